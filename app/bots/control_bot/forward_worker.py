@@ -21,12 +21,8 @@ logger = logging.getLogger(__name__)
 
 
 def _build_public_link(*, source_username: Optional[str], telegram_message_id: int) -> Optional[str]:
-    if not source_username:
-        return None
-    username = source_username.lstrip("@")
-    if not username:
-        return None
-    if telegram_message_id <= 0:
+    username = source_username.lstrip("@") if source_username else ""
+    if not username or telegram_message_id <= 0:
         return None
     return f"https://t.me/{username}/{telegram_message_id}"
 
@@ -48,13 +44,14 @@ def _format_delivery_text(*, source_title: str, source_username: Optional[str],
     text = getattr(msg, "text", None) or ""
     text = _truncate(text)
     filter_name = getattr(flt, "name", None) or f"filter_id={getattr(fw, 'filter_id', None)}"
-    header = f"Источник: {source_title}\nФильтр: {filter_name}"
-    if link:
-        header += f"\nСсылка: {link}"
-
-    if text:
-        return header + "\n\n" + text
-    return header + "\n\n(нет текста)"
+    lines = (
+        f"Источник: {source_title}",
+        f"Фильтр: {filter_name}",
+        *((f"Ссылка: {link}",) if link else ()),
+        "",
+        text or "(нет текста)",
+    )
+    return "\n".join(lines)
 
 
 async def deliver_pending_forever(
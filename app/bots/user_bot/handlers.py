@@ -25,7 +25,7 @@ from app.infra.db.base import get_db_session
 from app.infra.db.models import SourceType as DbSourceType
 from app.infra.db.repositories import SourceRepository
 from app.infra.logging.config import LogContext
-from app.routing.dispatcher import Dispatcher, IncomingMessage
+from app.routing.dispatcher import Dispatcher, IncomingMessage, NormalizationBatcher
 
 logger = logging.getLogger(__name__)
 
@@ -103,8 +103,12 @@ def _to_naive_utc(dt: datetime) -> datetime:
 
     Telethon provides timezone-aware UTC datetimes; our DB column is TIMESTAMP WITHOUT TIME ZONE.
     """
-    if dt.tzinfo is None:
+    tz = dt.tzinfo
+    if tz is None:
         return dt
+    if tz is timezone.utc:
+        # Common case for Telethon: already UTC, only the tzinfo has to go.
+        return dt.replace(tzinfo=None)
     return dt.astimezone(timezone.utc).replace(tzinfo=None)
 
 
@@ -203,13 +207,19 @@ class SourceCache:
                 logger.exception("Failed to refresh sources")
 
 
-def register_handlers(*, client: Any, source_cache: SourceCache) -> None:
+def register_handlers(
+    *,
+    client: Any,
+    source_cache: SourceCache,
+    normalizer: Optional[NormalizationBatcher] = None,
+) -> None:
     """
     Register Telethon event handlers.
 
     Args:
         client: Telethon TelegramClient instance
         source_cache: cache controlling which chat_ids are treated as sources
+        normalizer: optional shared batcher for text normalization across messages
     """
 
     @client.on(events.NewMessage)
@@ -225,7 +235,7 @@ def register_handlers(*, client: Any, source_cache: SourceCache) -> None:
             incoming = await telegram_event_to_incoming(event)
             with LogContext(message_id=incoming.telegram_message_id):
                 async with get_db_session() as session:
-                    dispatcher = Dispatcher(session=session, forwarder=None)
+                    dispatcher = Dispatcher(session=session, forwarder=None, normalizer=normalizer)
                     await dispatcher.dispatch(incoming)
 
         except Exception:
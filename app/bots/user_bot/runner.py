@@ -23,6 +23,8 @@ from app.bots.user_bot.client import create_userbot_client
 from app.bots.user_bot.handlers import SourceCache, register_handlers
 from app.infra.db.base import get_db_session
 from app.infra.db.repositories import SourceRepository
+from app.nlp.preprocess import preload_nlp
+from app.routing.dispatcher import NormalizationBatcher
 
 logger = logging.getLogger(__name__)
 
@@ -55,11 +57,15 @@ async def run_userbot(settings: Optional[TelegramUserBotSettings] = None) -> Non
             "USERBOT_PHONE is not set. If the session is not authorized yet, Telethon login will fail."
         )
 
+    # Load dictionaries/models once, before any message arrives.
+    await asyncio.to_thread(preload_nlp)
+
     client = create_userbot_client(settings)
 
     stop_event = asyncio.Event()
     source_cache = SourceCache(refresh_interval_seconds=60)
-    register_handlers(client=client, source_cache=source_cache)
+    normalizer = NormalizationBatcher()
+    register_handlers(client=client, source_cache=source_cache, normalizer=normalizer)
 
     refresh_task: Optional[asyncio.Task[object]] = None
     join_task: Optional[asyncio.Task[object]] = None
@@ -181,6 +187,7 @@ async def run_userbot(settings: Optional[TelegramUserBotSettings] = None) -> Non
             join_task.cancel()
             with contextlib.suppress(Exception):
                 await join_task
+        await normalizer.stop()
         await client.disconnect()
         logger.info("User-bot disconnected")
 
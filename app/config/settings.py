@@ -190,6 +190,13 @@ class FilterSettings(EnvBaseSettings):
     semantic_threshold: float = Field(
         default=0.7, ge=0.0, le=1.0, description="Default semantic similarity threshold"
     )
+    english_lemmatizer: str = Field(
+        default="wordnet",
+        description=(
+            "English lemmatizer backend. "
+            "Supported: 'wordnet' (NLTK) or 'spacy' (en_core_web_sm; falls back to WordNet if unavailable)."
+        ),
+    )
     embedding_model: str = Field(
         default="sentence-transformers/paraphrase-MiniLM-L3-v2",
         description="Sentence transformer model name",
@@ -200,6 +207,14 @@ class FilterSettings(EnvBaseSettings):
     max_message_length: int = Field(
         default=4096, description="Maximum message length to process (chars)"
     )
+    max_concurrent_subs: int = Field(
+        default=10, ge=1, description="Max concurrent per-subscriber forwards for one message"
+    )
+    user_rules_cache_ttl_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="TTL of the per-user active filter cache in the dispatcher (0 disables caching)",
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="FILTER_",
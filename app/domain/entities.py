@@ -5,11 +5,12 @@ This module defines Pydantic models for domain entities that represent
 business logic objects independent of the database layer.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class SourceType(str, Enum):
@@ -56,6 +57,8 @@ class KeywordOptions(BaseModel):
     Controls how keywords are matched in text.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     case_sensitive: bool = Field(
         default=False,
         description="Whether to perform case-sensitive matching",
@@ -86,6 +89,8 @@ class SemanticOptions(BaseModel):
     Controls semantic similarity calculation.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     threshold: float = Field(
         default=0.7,
         ge=0.0,
@@ -108,8 +113,12 @@ class FilterConfig(BaseModel):
 
     Defines how a filter should match messages, including keywords, topics,
     mode, and options for both keyword and semantic matching.
+
+    Instances are immutable so they can be safely shared (e.g. cached per filter version).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     mode: FilterMode = Field(
         default=FilterMode.COMBINED,
         description="Filter matching mode",
@@ -207,21 +216,29 @@ class MessageEntity(BaseModel):
     is_processed: bool = Field(default=False, description="Whether message was processed")
 
 
-class NormalizedText(BaseModel):
+@dataclass(frozen=True, slots=True)
+class NormalizedText:
     """
     Normalized text representation.
 
     Contains original text, normalized text, tokens, and detected language.
+
+    Built once per message by the NLP layer from trusted data, so it is a slotted
+    dataclass rather than a validated model.
+
+    Attributes:
+        original: Original text
+        normalized: Normalized text (lowercased, cleaned)
+        tokens: Tokenized words
+        language: Detected language code
+        lemmas: Lemmatized forms of tokens (optional)
     """
 
-    original: str = Field(description="Original text")
-    normalized: str = Field(description="Normalized text (lowercased, cleaned)")
-    tokens: list[str] = Field(default_factory=list, description="Tokenized words")
-    language: Optional[str] = Field(default=None, description="Detected language code")
-    lemmas: Optional[list[str]] = Field(
-        default=None,
-        description="Lemmatized forms of tokens (optional)",
-    )
+    original: str
+    normalized: str
+    tokens: list[str] = field(default_factory=list)
+    language: Optional[str] = None
+    lemmas: Optional[list[str]] = None
 
     @property
     def is_empty(self) -> bool:
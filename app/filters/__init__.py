@@ -10,6 +10,7 @@ from app.filters.keyword_matcher import (
     evaluate_filter_keywords,
     get_match_score,
     highlight_keywords,
+    keyword_match_satisfies_filter,
     match_filter_keywords,
     match_keywords_in_text,
 )
@@ -20,6 +21,7 @@ __all__ = [
     "evaluate_filter_keywords",
     "get_match_score",
     "highlight_keywords",
+    "keyword_match_satisfies_filter",
     "match_filter_keywords",
     "match_keywords_in_text",
 ]
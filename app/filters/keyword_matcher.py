@@ -22,6 +22,101 @@ from app.nlp.preprocess import normalize_text, prepare_keywords
 logger = logging.getLogger(__name__)
 
 
+# ================================================================================
+# Aho-Corasick automaton (optional, pyahocorasick)
+# ================================================================================
+
+
+def _get_ahocorasick() -> any:
+    """Get pyahocorasick module (lazy import)."""
+    try:
+        import ahocorasick
+
+        return ahocorasick
+    except ImportError:
+        logger.warning("pyahocorasick not installed, falling back to per-keyword substring search")
+        return None
+
+
+_AHOCORASICK = None
+_AHOCORASICK_CHECKED = False
+
+# Automatons keyed by the prepared keyword tuple; filter keywords change rarely, so each
+# keyword set is compiled once and then every message is scanned in a single pass.
+_AUTOMATON_CACHE: dict[tuple[str, ...], any] = {}
+_AUTOMATON_CACHE_MAX = 1024
+
+
+def _get_keyword_automaton(keywords: tuple[str, ...]) -> any:
+    """
+    Get cached Aho-Corasick automaton for keywords.
+
+    Returns:
+        Automaton whose values are the keywords, or None if pyahocorasick is unavailable.
+    """
+    global _AHOCORASICK, _AHOCORASICK_CHECKED
+    if not _AHOCORASICK_CHECKED:
+        _AHOCORASICK = _get_ahocorasick()
+        _AHOCORASICK_CHECKED = True
+    if _AHOCORASICK is None:
+        return None
+
+    automaton = _AUTOMATON_CACHE.get(keywords)
+    if automaton is not None:
+        return automaton
+
+    automaton = _AHOCORASICK.Automaton()
+    for keyword in keywords:
+        if keyword:
+            automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+
+    # Simple FIFO eviction to keep memory bounded.
+    if len(_AUTOMATON_CACHE) >= _AUTOMATON_CACHE_MAX:
+        first_key = next(iter(_AUTOMATON_CACHE))
+        del _AUTOMATON_CACHE[first_key]
+    _AUTOMATON_CACHE[keywords] = automaton
+    return automaton
+
+
+def _find_all_keyword_positions(
+    text: str, keywords: list[str], case_sensitive: bool = False
+) -> dict[str, list[int]]:
+    """
+    Find positions of all keywords in text (overlapping occurrences included).
+
+    Uses a single Aho-Corasick scan when pyahocorasick is available; otherwise
+    searches each keyword separately.
+
+    Args:
+        text: Text to search in
+        keywords: Prepared keywords (already lowercased unless case_sensitive)
+        case_sensitive: Whether to use case-sensitive search
+
+    Returns:
+        Mapping keyword -> ascending list of start positions (only found keywords)
+    """
+    if not text or not keywords:
+        return {}
+
+    automaton = _get_keyword_automaton(tuple(keywords))
+    if automaton is None:
+        found = {}
+        for keyword in keywords:
+            keyword_positions = _find_keyword_positions(text, keyword, case_sensitive=case_sensitive)
+            if keyword_positions:
+                found[keyword] = keyword_positions
+        return found
+
+    search_text = text if case_sensitive else text.lower()
+    found: dict[str, list[int]] = {}
+    for end_index, keyword in automaton.iter(search_text):
+        found.setdefault(keyword, []).append(end_index - len(keyword) + 1)
+    for keyword_positions in found.values():
+        keyword_positions.sort()
+    return found
+
+
 # ================================================================================
 # Keyword Matching Core Functions
 # ================================================================================
@@ -255,10 +350,9 @@ def match_keywords_in_text(
         search_tokens = normalized_text.tokens
         logger.debug(f"Using token-based matching with {len(search_tokens)} tokens")
 
-    # Match each keyword
-    for keyword in prepared_keywords:
-        if options.whole_word or effective_use_lemmatization:
-            # Use token-based matching for whole word or lemmatization
+    if options.whole_word or effective_use_lemmatization:
+        # Use token-based matching for whole word or lemmatization
+        for keyword in prepared_keywords:
             matched = match_keyword_in_tokens(
                 search_tokens,
                 keyword,
@@ -269,15 +363,16 @@ def match_keywords_in_text(
                 match_count += 1
                 # For token-based matching, we don't track exact positions
                 positions[keyword] = []
-        else:
-            # Use simple text search for partial matches
-            matched, keyword_positions = match_keyword_simple(
-                normalized_text.normalized if not options.case_sensitive else text,
-                keyword,
-                case_sensitive=options.case_sensitive,
-                whole_word=False,
-            )
-            if matched:
+    else:
+        # Use text search for partial matches (all keywords in one scan)
+        found = _find_all_keyword_positions(
+            normalized_text.normalized if not options.case_sensitive else text,
+            prepared_keywords,
+            case_sensitive=options.case_sensitive,
+        )
+        for keyword in prepared_keywords:
+            keyword_positions = found.get(keyword)
+            if keyword_positions:
                 matched_keywords.append(keyword)
                 match_count += len(keyword_positions)
                 positions[keyword] = keyword_positions
@@ -395,7 +490,23 @@ def evaluate_filter_keywords(
         return False
 
     match_result = match_filter_keywords(text, filter_config, normalized_text)
+    return keyword_match_satisfies_filter(match_result, filter_config)
+
+
+def keyword_match_satisfies_filter(match_result: KeywordMatch, filter_config: FilterConfig) -> bool:
+    """
+    Check whether an existing keyword match meets filter keyword requirements.
+
+    Lets callers that already hold the KeywordMatch (e.g. to show matched keywords)
+    get the verdict of evaluate_filter_keywords without matching the text again.
 
+    Args:
+        match_result: Result of match_filter_keywords for the filter
+        filter_config: Filter configuration
+
+    Returns:
+        True if the match satisfies the filter's keyword requirements
+    """
     if not match_result.has_match:
         return False
 
@@ -460,15 +571,33 @@ def highlight_keywords(
     if not match.has_match or not text:
         return text
 
-    highlighted = text
-
     # Sort keywords by length (longest first) to avoid partial replacements
-    sorted_keywords = sorted(match.matched_keywords, key=len, reverse=True)
+    sorted_keywords = tuple(k for k in sorted(match.matched_keywords, key=len, reverse=True) if k)
+    if not sorted_keywords:
+        return text
+
+    # One case-insensitive pass for all keywords; this also keeps a shorter keyword from
+    # being highlighted again inside an already highlighted longer one.
+    pattern = _get_highlight_pattern(sorted_keywords)
+    replacement = highlight_format.replace("{keyword}", r"\g<0>")
+    return pattern.sub(replacement, text)
+
+
+_HIGHLIGHT_PATTERN_CACHE: dict[tuple[str, ...], re.Pattern] = {}
+_HIGHLIGHT_PATTERN_CACHE_MAX = 1024
+
+
+def _get_highlight_pattern(keywords: tuple[str, ...]) -> re.Pattern:
+    """Get cached case-insensitive alternation of keywords (earlier keywords win)."""
+    pattern = _HIGHLIGHT_PATTERN_CACHE.get(keywords)
+    if pattern is not None:
+        return pattern
 
-    for keyword in sorted_keywords:
-        # Use case-insensitive replacement
-        pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-        replacement = highlight_format.replace("{keyword}", r"\g<0>")
-        highlighted = pattern.sub(replacement, highlighted)
+    pattern = re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE)
 
-    return highlighted
\ No newline at end of file
+    # Simple FIFO eviction to keep memory bounded.
+    if len(_HIGHLIGHT_PATTERN_CACHE) >= _HIGHLIGHT_PATTERN_CACHE_MAX:
+        first_key = next(iter(_HIGHLIGHT_PATTERN_CACHE))
+        del _HIGHLIGHT_PATTERN_CACHE[first_key]
+    _HIGHLIGHT_PATTERN_CACHE[keywords] = pattern
+    return pattern
\ No newline at end of file
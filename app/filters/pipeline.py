@@ -23,7 +23,7 @@ from app.domain.entities import (
     SemanticOptions,
 )
 from app.filters.keyword_matcher import get_match_score as get_keyword_score
-from app.filters.keyword_matcher import match_filter_keywords
+from app.filters.keyword_matcher import keyword_match_satisfies_filter, match_filter_keywords
 from app.filters.semantic_matcher import get_semantic_score, match_filter_semantic
 from app.nlp.preprocess import normalize_text
 
@@ -89,14 +89,9 @@ class _NormalizerCache:
 
 
 def _requirement_satisfied_by_keyword_match(rule: FilterRule, keyword_match) -> bool:
-    if not keyword_match.has_match:
-        return False
-    if rule.config.require_all_keywords:
-        # Treat match as satisfied only if all configured keywords were hit.
-        # Note: matched_keywords can contain normalized variants; for current pipeline
-        # behavior we compare lengths.
-        return len(keyword_match.matched_keywords) == len(rule.config.keywords)
-    return True
+    # Note: matched_keywords can contain normalized variants; with require_all_keywords
+    # the check compares lengths (same rule as evaluate_filter_keywords).
+    return keyword_match_satisfies_filter(keyword_match, rule.config)
 
 
 def apply_filter(
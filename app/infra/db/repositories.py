@@ -15,7 +15,8 @@ import logging
 from datetime import datetime
 from typing import Generic, List, Optional, Type, TypeVar
 
-from sqlalchemy import Select, and_, delete, func, or_, select, update
+from sqlalchemy import Select, and_, delete, func, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -430,6 +431,42 @@ class FilterRepository(BaseRepository[Filter]):
     def __init__(self, session: AsyncSession):
         super().__init__(Filter, session)
 
+    async def _touch_user(self, user_id: int) -> None:
+        """
+        Bump the owner's updated_at.
+
+        The dispatcher caches built filter rules per user and uses `users.updated_at`
+        as the cache version, so every filter change must move it.
+        """
+        await self.session.execute(
+            update(User).where(User.id == user_id).values(updated_at=datetime.utcnow())
+        )
+
+    async def create(self, **kwargs) -> Filter:
+        """Create filter and bump the owner's version."""
+        entity = await super().create(**kwargs)
+        await self._touch_user(int(entity.user_id))
+        return entity
+
+    async def update(self, id: int, **kwargs) -> Optional[Filter]:
+        """Update filter and bump the owner's version."""
+        entity = await super().update(id, **kwargs)
+        if entity is not None:
+            await self._touch_user(int(entity.user_id))
+        return entity
+
+    async def delete(self, id: int) -> bool:
+        """Delete filter and bump the owner's version."""
+        entity = await self.get(id)
+        if entity is None:
+            return False
+        user_id = int(entity.user_id)
+
+        deleted = await super().delete(id)
+        if deleted:
+            await self._touch_user(user_id)
+        return deleted
+
     async def get_user_filters(self, user_id: int, active_only: bool = True) -> List[Filter]:
         """
         Get all filters for a user.
@@ -449,6 +486,26 @@ class FilterRepository(BaseRepository[Filter]):
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_active_filters_for_users(self, user_ids: list[int]) -> List[Filter]:
+        """
+        Get active filters of several users in one query.
+
+        Args:
+            user_ids: User IDs
+
+        Returns:
+            List of active filters (ordered by user_id, id)
+        """
+        if not user_ids:
+            return []
+
+        result = await self.session.execute(
+            select(Filter)
+            .where(and_(Filter.user_id.in_(user_ids), Filter.is_active == True))
+            .order_by(Filter.user_id, Filter.id)
+        )
+        return list(result.scalars().all())
+
     async def get_active_filters(self) -> List[Filter]:
         """
         Get all active filters.
@@ -536,6 +593,10 @@ class MessageRepository(BaseRepository[Message]):
         """
         Get or create message by Telegram message ID and chat ID.
 
+        Incoming messages are almost always new, so this inserts first
+        (ON CONFLICT DO NOTHING) and only falls back to a SELECT for duplicates:
+        one round-trip in the common case instead of two.
+
         Args:
             telegram_message_id: Telegram message ID
             chat_id: Telegram chat ID
@@ -544,14 +605,19 @@ class MessageRepository(BaseRepository[Message]):
         Returns:
             Tuple of (message, created) where created is True if message was created
         """
-        message = await self.get_by_telegram_id(telegram_message_id, chat_id)
-        if message:
-            return message, False
-
-        message = await self.create(
-            telegram_message_id=telegram_message_id, chat_id=chat_id, **kwargs
+        stmt = (
+            pg_insert(Message)
+            .values(telegram_message_id=telegram_message_id, chat_id=chat_id, **kwargs)
+            .on_conflict_do_nothing(index_elements=["telegram_message_id", "chat_id"])
+            .returning(Message)
         )
-        return message, True
+        result = await self.session.execute(stmt)
+        message = result.scalar_one_or_none()
+        if message is not None:
+            return message, True
+
+        message = await self.get_by_telegram_id(telegram_message_id, chat_id)
+        return message, False
 
     async def get_source_messages(
         self, source_id: int, skip: int = 0, limit: int = 100
@@ -702,6 +768,27 @@ class FilterMatchRepository(BaseRepository[FilterMatch]):
         match = await self.create(message_id=message_id, filter_id=filter_id, **kwargs)
         return match, True
 
+    async def bulk_create(self, rows: list[dict]) -> List[int]:
+        """
+        Insert many filter matches in one statement, skipping already existing ones.
+
+        Args:
+            rows: Match attributes (message_id, filter_id, match_type, score, details)
+
+        Returns:
+            IDs of newly created matches (existing (message_id, filter_id) pairs are skipped)
+        """
+        if not rows:
+            return []
+
+        stmt = (
+            pg_insert(FilterMatch)
+            .on_conflict_do_nothing(index_elements=["message_id", "filter_id"])
+            .returning(FilterMatch.id)
+        )
+        result = await self.session.execute(stmt, rows)
+        return list(result.scalars().all())
+
     async def get_top_matches(
         self, filter_id: int, min_score: float = 0.0, limit: int = 100
     ) -> List[FilterMatch]:
@@ -780,6 +867,23 @@ class ForwardedMessageRepository(BaseRepository[ForwardedMessage]):
         )
         return list(result.scalars().all())
 
+    async def bulk_create(self, rows: list[dict]) -> List[int]:
+        """
+        Insert many forwarded message records in one statement.
+
+        Args:
+            rows: Forward attributes (user_id, filter_id, message_id, target_chat_id, status)
+
+        Returns:
+            IDs of created records, in the same order as rows
+        """
+        if not rows:
+            return []
+
+        stmt = insert(ForwardedMessage).returning(ForwardedMessage.id, sort_by_parameter_order=True)
+        result = await self.session.execute(stmt, rows)
+        return list(result.scalars().all())
+
     async def mark_as_sent(
         self, forwarded_id: int, forwarded_telegram_message_id: int
     ) -> Optional[ForwardedMessage]:
@@ -9,7 +9,9 @@ from app.nlp.preprocess import (
     detect_language,
     lemmatize,
     normalize_text,
+    normalize_text_batch,
     normalize_whitespace,
+    preload_nlp,
     prepare_keyword,
     prepare_keywords,
     remove_emojis,
@@ -21,7 +23,9 @@ __all__ = [
     "detect_language",
     "lemmatize",
     "normalize_text",
+    "normalize_text_batch",
     "normalize_whitespace",
+    "preload_nlp",
     "prepare_keyword",
     "prepare_keywords",
     "remove_emojis",
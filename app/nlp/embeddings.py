@@ -128,6 +128,9 @@ class EmbeddingModel:
         Uses LRU cache to avoid re-encoding the same texts.
         Cache key is based on text hash and model name.
 
+        The cached array itself is returned (the same object on every hit), so callers
+        must not modify it in place.
+
         Args:
             text: Text to encode
             normalize: Whether to normalize embedding
@@ -264,6 +267,16 @@ def get_embedding_model(model_name: Optional[str] = None) -> EmbeddingModel:
     return EmbeddingModel.get_instance(model_name=model_name)
 
 
+def reset_embedding_model() -> None:
+    """
+    Drop the embedding model singleton.
+
+    The next `get_embedding_model()` call creates a fresh instance (and loads the model lazily).
+    The embedding cache is not touched; use `clear_embedding_cache()` for that.
+    """
+    EmbeddingModel._instance = None
+
+
 def encode_text(
     text: str,
     use_cache: bool = True,
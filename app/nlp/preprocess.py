@@ -11,11 +11,14 @@ This module provides functions for:
 
 import logging
 import re
+import string
 import zipfile
+from collections.abc import Callable
 from typing import Optional
 
 import nltk
 
+from app.config.settings import get_settings
 from app.domain.entities import Language, NormalizedText
 
 logger = logging.getLogger(__name__)
@@ -101,12 +104,90 @@ def _get_nltk_lemmatizer() -> any:
         return None
 
 
+class _SpacyLemmatizer:
+    """
+    Adapter exposing spaCy's lemmatizer through the WordNetLemmatizer interface.
+
+    spaCy's pipeline runs in Cython and is much faster than WordNet for bulk use,
+    especially when tokens are streamed through `nlp.pipe`.
+    """
+
+    def __init__(self, nlp: any):
+        self._nlp = nlp
+
+    def lemmatize(self, token: str) -> str:
+        doc = self._nlp(token)
+        return doc[0].lemma_ if len(doc) else token
+
+    def lemmatize_batch(self, tokens: list[str], batch_size: int = 1000) -> list[str]:
+        docs = self._nlp.pipe(tokens, batch_size=batch_size, n_process=1)
+        return [
+            doc[0].lemma_ if len(doc) else token for token, doc in zip(tokens, docs, strict=True)
+        ]
+
+
+def _get_spacy_lemmatizer() -> any:
+    """Get spaCy lemmatizer for English (lazy import)."""
+    try:
+        import spacy
+
+        # Parser and NER are not needed for lemmas; tagger/attribute_ruler must stay enabled
+        # (and with them tok2vec, which the tagger listens to in en_core_web_sm).
+        nlp = spacy.load("en_core_web_sm", disable=["parser", "ner"])
+        return _SpacyLemmatizer(nlp)
+    except ImportError:
+        logger.warning("spacy not installed, falling back to NLTK WordNet lemmatizer")
+        return None
+    except OSError:
+        logger.warning("spaCy model en_core_web_sm not found, falling back to NLTK WordNet lemmatizer")
+        return None
+
+
+def _get_english_lemmatizer() -> any:
+    """Get English lemmatizer for the configured backend (spaCy or NLTK WordNet)."""
+    backend = (get_settings().filter.english_lemmatizer or "wordnet").strip().lower()
+    if backend == "spacy":
+        lemmatizer = _get_spacy_lemmatizer()
+        if lemmatizer is not None:
+            return lemmatizer
+    return _get_nltk_lemmatizer()
+
+
 # Cache for lazy-loaded objects
 _LANG_DETECTOR = None
 _RUSSIAN_ANALYZER = None
 _ENGLISH_LEMMATIZER = None
 
 
+def preload_nlp() -> None:
+    """
+    Eagerly load NLP resources (language detector, pymorphy3 dictionaries, English lemmatizer).
+
+    Call once at process startup: the first messages then don't pay the cold-start cost,
+    and if the process forks workers afterwards they share the loaded (read-only)
+    dictionaries copy-on-write instead of loading one copy each.
+    """
+    global _LANG_DETECTOR, _RUSSIAN_ANALYZER, _ENGLISH_LEMMATIZER
+
+    if _LANG_DETECTOR is None:
+        _LANG_DETECTOR = _get_langdetect_detector()
+    if _RUSSIAN_ANALYZER is None:
+        _RUSSIAN_ANALYZER = _get_pymorphy2_analyzer()
+    if _ENGLISH_LEMMATIZER is None:
+        _ENGLISH_LEMMATIZER = _get_english_lemmatizer()
+
+    # Touch each resource once: langdetect profiles and the WordNet corpus load lazily.
+    try:
+        if _LANG_DETECTOR is not None:
+            _LANG_DETECTOR("warm up language profiles")
+        if _RUSSIAN_ANALYZER is not None:
+            _RUSSIAN_ANALYZER.parse("прогрев")
+        if _ENGLISH_LEMMATIZER is not None:
+            _ENGLISH_LEMMATIZER.lemmatize("resources")
+    except Exception as e:
+        logger.warning(f"NLP warm-up failed: {e}")
+
+
 # ================================================================================
 # Language Detection
 # ================================================================================
@@ -149,6 +230,55 @@ def detect_language(text: str) -> Optional[str]:
 # Text Cleaning
 # ================================================================================
 
+# Precompiled patterns (hot path: every incoming message goes through them).
+_HTTP_URL_RE = re.compile(r"https?://\S+")
+_WWW_URL_RE = re.compile(r"www\.\S+")
+_TME_LINK_RE = re.compile(r"t\.me/\S+")
+_MENTION_RE = re.compile(r"@\w+")
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x1f\x7f-\x9f]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[^\w\s]", flags=re.UNICODE)
+_WORD_RE = re.compile(r"\w+", flags=re.UNICODE)
+
+# Emoji pattern (covers most common emoji ranges)
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags (iOS)
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U0001F251"
+    "\U0001F900-\U0001F9FF"  # supplemental symbols and pictographs
+    "\U0001FA00-\U0001FA6F"  # chess symbols
+    "]+",
+    flags=re.UNICODE,
+)
+
+# Characters that punctuation stripping never touches (ASCII word chars + common whitespace).
+_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "_ \t\n\r")
+
+# Emojis, punctuation/symbols and control characters all become spaces in the
+# `normalized` string, so one combined pattern replaces three separate passes.
+_NOISE_RE = re.compile(rf"[^\w\s]|{_EMOJI_RE.pattern}", flags=re.UNICODE)
+
+
+def _strip_links_and_mentions(text: str, remove_urls: bool, remove_mentions: bool) -> str:
+    """Replace URLs / t.me links and (optionally) @mentions with spaces."""
+    if remove_urls:
+        # Remove http/https URLs
+        text = _HTTP_URL_RE.sub(" ", text)
+        # Remove www URLs
+        text = _WWW_URL_RE.sub(" ", text)
+        # Remove t.me links
+        text = _TME_LINK_RE.sub(" ", text)
+
+    # Remove Telegram mentions
+    if remove_mentions:
+        text = _MENTION_RE.sub(" ", text)
+
+    return text
+
 
 def clean_text(text: str, remove_urls: bool = True, remove_mentions: bool = False) -> str:
     """
@@ -171,24 +301,13 @@ def clean_text(text: str, remove_urls: bool = True, remove_mentions: bool = Fals
     if not text:
         return ""
 
-    # Remove URLs
-    if remove_urls:
-        # Remove http/https URLs
-        text = re.sub(r"https?://\S+", " ", text)
-        # Remove www URLs
-        text = re.sub(r"www\.\S+", " ", text)
-        # Remove t.me links
-        text = re.sub(r"t\.me/\S+", " ", text)
-
-    # Remove Telegram mentions
-    if remove_mentions:
-        text = re.sub(r"@\w+", " ", text)
+    text = _strip_links_and_mentions(text, remove_urls, remove_mentions)
 
     # Remove control characters
-    text = re.sub(r"[\x00-\x1f\x7f-\x9f]", " ", text)
+    text = _CONTROL_CHARS_RE.sub(" ", text)
 
     # Replace multiple spaces with single space
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
 
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -206,21 +325,7 @@ def remove_emojis(text: str) -> str:
     Returns:
         Text without emojis
     """
-    # Emoji pattern (covers most common emoji ranges)
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map symbols
-        "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-        "\U00002702-\U000027B0"
-        "\U000024C2-\U0001F251"
-        "\U0001F900-\U0001F9FF"  # supplemental symbols and pictographs
-        "\U0001FA00-\U0001FA6F"  # chess symbols
-        "]+",
-        flags=re.UNICODE,
-    )
-    return emoji_pattern.sub(" ", text)
+    return _EMOJI_RE.sub(" ", text)
 
 
 def normalize_whitespace(text: str) -> str:
@@ -236,7 +341,7 @@ def normalize_whitespace(text: str) -> str:
         Text with normalized whitespace
     """
     # Replace all whitespace sequences with single space
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     return text.strip()
 
 
@@ -260,7 +365,7 @@ def tokenize_simple(text: str, min_length: int = 1) -> list[str]:
         return []
 
     # Split on non-word characters (keeps letters, numbers, underscores)
-    tokens = re.findall(r"\w+", text, re.UNICODE)
+    tokens = _WORD_RE.findall(text)
 
     # Filter by minimum length
     tokens = [t for t in tokens if len(t) >= min_length]
@@ -327,6 +432,28 @@ def tokenize(text: str, language: Optional[str] = None, use_nltk: bool = True) -
 # ================================================================================
 
 
+# Script guards: each analyzer only handles its own alphabet, other tokens are just lowercased.
+_IS_CYRILLIC = re.compile(r"[а-яёА-ЯЁ\-]+").fullmatch
+_IS_LATIN = re.compile(r"[a-zA-Z\-]+").fullmatch
+
+
+def _lemmatize_each_safely(lemma_fn: Callable[[str], str], tokens: list[str]) -> list[str]:
+    """
+    Slow path for lemmatizers: guard every token separately.
+
+    Analyzers rarely raise, so callers first lemmatize the whole list under a single
+    handler and only fall back here; failed tokens are kept lowercased.
+    """
+    lemmas = []
+    for token in tokens:
+        try:
+            lemmas.append(lemma_fn(token))
+        except Exception as e:
+            logger.debug(f"Failed to lemmatize token '{token}': {e}")
+            lemmas.append(token.lower())
+    return lemmas
+
+
 def lemmatize_russian(tokens: list[str]) -> list[str]:
     """
     Lemmatize Russian tokens using pymorphy2.
@@ -349,23 +476,26 @@ def lemmatize_russian(tokens: list[str]) -> list[str]:
         logger.warning("Russian lemmatization not available, returning original tokens")
         return tokens
 
-    lemmas = []
-    for token in tokens:
-        try:
-            # Get the normal form (lemma) of the word
-            parsed = _RUSSIAN_ANALYZER.parse(token)[0]
-            lemma = parsed.normal_form
-            lemmas.append(lemma)
-        except Exception as e:
-            logger.debug(f"Failed to lemmatize token '{token}': {e}")
-            lemmas.append(token.lower())
+    parse = _RUSSIAN_ANALYZER.parse
 
-    return lemmas
+    def _normal_form(token: str) -> str:
+        if not _IS_CYRILLIC(token):
+            return token.lower()
+        # Get the normal form (lemma) of the word
+        return parse(token)[0].normal_form
+
+    try:
+        return [_normal_form(token) for token in tokens]
+    except Exception:
+        return _lemmatize_each_safely(_normal_form, tokens)
 
 
 def lemmatize_english(tokens: list[str]) -> list[str]:
     """
-    Lemmatize English tokens using NLTK WordNet lemmatizer.
+    Lemmatize English tokens using the configured backend (NLTK WordNet or spaCy).
+
+    With spaCy, the Latin tokens are streamed through `nlp.pipe` in one pass rather
+    than running the pipeline once per token; per-token calls are only the fallback.
 
     Args:
         tokens: List of tokens to lemmatize
@@ -379,23 +509,52 @@ def lemmatize_english(tokens: list[str]) -> list[str]:
         return []
 
     if _ENGLISH_LEMMATIZER is None:
-        _ENGLISH_LEMMATIZER = _get_nltk_lemmatizer()
+        _ENGLISH_LEMMATIZER = _get_english_lemmatizer()
 
     if _ENGLISH_LEMMATIZER is None:
         logger.warning("English lemmatization not available, returning original tokens")
         return tokens
 
-    lemmas = []
-    for token in tokens:
+    lemmatizer = _ENGLISH_LEMMATIZER
+
+    def lemmatize_token(token: str) -> str:
+        # Lemmatize as noun by default (most common case)
+        return lemmatizer.lemmatize(token) if _IS_LATIN(token) else token
+
+    lowered = [t.lower() for t in tokens]
+
+    if isinstance(lemmatizer, _SpacyLemmatizer):
+        latin_idx = [i for i, t in enumerate(lowered) if _IS_LATIN(t)]
         try:
-            # Lemmatize as noun by default (most common case)
-            lemma = _ENGLISH_LEMMATIZER.lemmatize(token.lower())
-            lemmas.append(lemma)
+            lemmas = list(lowered)
+            latin_lemmas = lemmatizer.lemmatize_batch([lowered[i] for i in latin_idx])
+            for i, lemma in zip(latin_idx, latin_lemmas, strict=True):
+                lemmas[i] = lemma
+            return lemmas
         except Exception as e:
-            logger.debug(f"Failed to lemmatize token '{token}': {e}")
-            lemmas.append(token.lower())
+            logger.debug(f"Batch lemmatization failed, falling back to per-token: {e}")
+            return _lemmatize_each_safely(lemmatize_token, lowered)
+
+    try:
+        return [lemmatize_token(token) for token in lowered]
+    except Exception:
+        return _lemmatize_each_safely(lemmatize_token, lowered)
 
-    return lemmas
+
+def lemmatize_english_batch(tokens: list[str]) -> list[str]:
+    """
+    Lemmatize a large batch of English tokens.
+
+    Equivalent to `lemmatize_english`, which already uses `nlp.pipe` with the spaCy
+    backend; kept as the entry point for flattened multi-text batches.
+
+    Args:
+        tokens: List of tokens to lemmatize
+
+    Returns:
+        List of lemmatized tokens
+    """
+    return lemmatize_english(tokens)
 
 
 def lemmatize(tokens: list[str], language: Optional[str] = None) -> list[str]:
@@ -472,32 +631,16 @@ def normalize_text(
         )
 
     # Detect language if AUTO
-    detected_lang = None
-    if language == Language.AUTO:
-        detected_lang = detect_language(text)
-        logger.debug(f"Auto-detected language: {detected_lang}")
-    else:
-        detected_lang = language.value
-
-    # Clean text
-    cleaned = clean_text(text, remove_urls=remove_urls, remove_mentions=remove_mentions)
-
-    # Remove emojis if requested
-    if remove_emojis_flag:
-        cleaned = remove_emojis(cleaned)
-
-    # Remove punctuation / symbols (keep letters, numbers, underscores, whitespace).
-    # This matches the unit-test expectation that "Hello World!" -> "hello world".
-    cleaned = re.sub(r"[^\w\s]", " ", cleaned, flags=re.UNICODE)
-
-    # Normalize whitespace
-    cleaned = normalize_whitespace(cleaned)
-
-    # Convert to lowercase if requested
-    if lowercase:
-        normalized = cleaned.lower()
-    else:
-        normalized = cleaned
+    detected_lang = _resolve_language(text, language)
+
+    # Clean text, drop punctuation/emojis, lowercase
+    normalized = _clean_for_normalization(
+        text,
+        lowercase=lowercase,
+        remove_urls=remove_urls,
+        remove_mentions=remove_mentions,
+        remove_emojis_flag=remove_emojis_flag,
+    )
 
     # Tokenize
     tokens = tokenize(normalized, language=detected_lang, use_nltk=use_nltk_tokenizer)
@@ -519,6 +662,135 @@ def normalize_text(
     )
 
 
+def normalize_text_batch(
+    texts: list[str],
+    language: Language = Language.AUTO,
+    lowercase: bool = True,
+    remove_urls: bool = True,
+    remove_mentions: bool = False,
+    remove_emojis_flag: bool = True,
+    use_lemmatization: bool = True,
+    use_nltk_tokenizer: bool = False,
+    min_token_length: int = 2,
+) -> list[NormalizedText]:
+    """
+    Normalize a batch of texts.
+
+    Produces the same results as calling `normalize_text` for every text, but
+    lemmatization is grouped by language: tokens of all texts in the same language
+    are lemmatized in a single call (streamed through `nlp.pipe` with the spaCy
+    backend), which amortizes per-call analyzer overhead under burst load.
+
+    Args:
+        texts: Original texts to normalize
+        (other arguments are the same as for `normalize_text`)
+
+    Returns:
+        List of NormalizedText objects, in the same order as `texts`
+    """
+    if not texts:
+        return []
+
+    langs = [_resolve_language(t, language) if t else None for t in texts]
+    normalized = [
+        _clean_for_normalization(
+            t,
+            lowercase=lowercase,
+            remove_urls=remove_urls,
+            remove_mentions=remove_mentions,
+            remove_emojis_flag=remove_emojis_flag,
+        )
+        if t
+        else ""
+        for t in texts
+    ]
+    tokens = [
+        [
+            tok
+            for tok in tokenize(n, language=lang, use_nltk=use_nltk_tokenizer)
+            if len(tok) >= min_token_length
+        ]
+        for n, lang in zip(normalized, langs, strict=True)
+    ]
+
+    lemmas: list[Optional[list[str]]] = [[] if not t else None for t in texts]
+    if use_lemmatization:
+        for lang in set(langs):
+            idx = [
+                i
+                for i, text_lang in enumerate(langs)
+                if text_lang == lang and texts[i] and tokens[i]
+            ]
+            if not idx:
+                continue
+            flat = [tok for i in idx for tok in tokens[i]]
+            if lang == "en":
+                flat_lemmas = lemmatize_english_batch(flat)
+            else:
+                flat_lemmas = lemmatize(flat, language=lang)
+            pos = 0
+            for i in idx:
+                lemmas[i] = flat_lemmas[pos : pos + len(tokens[i])]
+                pos += len(tokens[i])
+
+    return [
+        NormalizedText(original=t, normalized=n, tokens=toks, language=lang, lemmas=lem)
+        for t, n, toks, lang, lem in zip(texts, normalized, tokens, langs, lemmas, strict=True)
+    ]
+
+
+def _resolve_language(text: str, language: Language) -> Optional[str]:
+    """Return language code for text, auto-detecting it if requested."""
+    if language == Language.AUTO:
+        detected_lang = detect_language(text)
+        logger.debug(f"Auto-detected language: {detected_lang}")
+        return detected_lang
+    return language.value
+
+
+def _clean_for_normalization(
+    text: str,
+    *,
+    lowercase: bool,
+    remove_urls: bool,
+    remove_mentions: bool,
+    remove_emojis_flag: bool,
+) -> str:
+    """Produce the `normalized` string of NormalizedText (cleaned, punctuation-free)."""
+    if remove_emojis_flag:
+        # Fused path (the default): a single substitution for emojis, punctuation and
+        # control characters, then one split/join for whitespace. `str.split()` and
+        # regex `\s` agree on what counts as whitespace.
+        cleaned = _strip_links_and_mentions(text, remove_urls, remove_mentions)
+        if cleaned.isascii():
+            # No emojis possible in ASCII: the plain punctuation pattern is enough, and
+            # it can be skipped entirely when there is nothing to strip.
+            if not _SAFE_CHARS.issuperset(cleaned):
+                cleaned = _PUNCT_RE.sub(" ", cleaned)
+        else:
+            cleaned = _NOISE_RE.sub(" ", cleaned)
+        cleaned = " ".join(cleaned.split())
+        # str.lower() already has an ASCII fast path in CPython; a str.translate table
+        # measured 2-20x slower here, so there is no special-casing for ASCII input.
+        return cleaned.lower() if lowercase else cleaned
+
+    # Clean text
+    cleaned = clean_text(text, remove_urls=remove_urls, remove_mentions=remove_mentions)
+
+    # Remove punctuation / symbols (keep letters, numbers, underscores, whitespace).
+    # This matches the unit-test expectation that "Hello World!" -> "hello world".
+    if not _SAFE_CHARS.issuperset(cleaned):
+        cleaned = _PUNCT_RE.sub(" ", cleaned)
+
+    # Normalize whitespace
+    cleaned = normalize_whitespace(cleaned)
+
+    # Convert to lowercase if requested
+    if lowercase:
+        return cleaned.lower()
+    return cleaned
+
+
 # ================================================================================
 # Utility Functions
 # ================================================================================
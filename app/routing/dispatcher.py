@@ -10,16 +10,20 @@ Responsibilities:
 - persist match results and create forwarding tasks/records
 
 Telegram integration is intentionally abstracted via an optional `Forwarder`.
+Text normalization can be micro-batched across concurrently dispatched messages via an
+optional long-lived `NormalizationBatcher`.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional, Protocol
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.settings import get_settings
@@ -49,7 +53,7 @@ from app.infra.db.repositories import (
     SubscriptionRepository,
     UserRepository,
 )
-from app.nlp.preprocess import normalize_text
+from app.nlp.preprocess import normalize_text, normalize_text_batch
 
 logger = logging.getLogger(__name__)
 
@@ -68,7 +72,9 @@ class Forwarder(Protocol):
 
 
 class IncomingMessage(BaseModel):
-    """Incoming message payload from user-bot."""
+    """Incoming message payload from user-bot (validated once at the ingress edge)."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     telegram_message_id: int
     chat_id: int
@@ -85,7 +91,7 @@ class IncomingMessage(BaseModel):
     source_username: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DispatchResult:
     message_id: int
     source_id: int
@@ -95,40 +101,150 @@ class DispatchResult:
     forwards_sent: int
 
 
+class NormalizationBatcher:
+    """
+    Micro-batching front-end for `normalize_text_batch`.
+
+    Collects texts from concurrently dispatched messages and normalizes them together.
+    A single long-lived worker task takes whatever is already queued (up to
+    `max_batch_size` texts) and flushes at once, so a message arriving alone is never
+    delayed waiting for company; each caller awaits only its own result.
+
+    Lemmatization is off by default: the dispatcher's normalized text only feeds
+    semantic matching, which uses the cleaned string. Even then each text still goes
+    through language detection (langdetect, with `Language.AUTO`), cleaning and
+    tokenization, so every batch runs in a thread to keep that work off the event loop;
+    batching shares one thread hop among the messages that arrived together.
+    """
+
+    def __init__(self, *, max_batch_size: int = 32, use_lemmatization: bool = False):
+        self._max_batch_size = max_batch_size
+        self._use_lemmatization = use_lemmatization
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future[NormalizedText]]] = asyncio.Queue()
+        self._worker: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        """Start the worker task (no-op if already running)."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(), name="normalization_batcher")
+
+    async def stop(self) -> None:
+        """Stop the worker task; texts in flight or still queued are cancelled."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        # Drain only after the worker has fully stopped, so nothing is taken off the queue
+        # between the drain and the cancellation.
+        while not self._queue.empty():
+            _text, fut = self._queue.get_nowait()
+            if not fut.done():
+                fut.cancel()
+
+    async def normalize(self, text: str) -> NormalizedText:
+        """Queue text for normalization and wait for its result."""
+        self.start()
+        fut: asyncio.Future[NormalizedText] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, fut))
+        return await fut
+
+    async def _run(self) -> None:
+        batch: list[tuple[str, asyncio.Future[NormalizedText]]] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                while len(batch) < self._max_batch_size and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+
+                texts = [text for text, _fut in batch]
+                try:
+                    results = await asyncio.to_thread(
+                        normalize_text_batch, texts, use_lemmatization=self._use_lemmatization
+                    )
+                    # strict: a short result list fails the remaining callers below
+                    # instead of leaving them waiting.
+                    for (_text, fut), res in zip(batch, results, strict=True):
+                        if not fut.done():
+                            fut.set_result(res)
+                except Exception as e:
+                    logger.exception(
+                        "Batch normalization failed", extra={"extra_data": {"size": len(texts)}}
+                    )
+                    for _text, fut in batch:
+                        if not fut.done():
+                            fut.set_exception(e)
+        except asyncio.CancelledError:
+            # Callers of the batch taken off the queue must not wait forever on shutdown.
+            for _text, fut in batch:
+                if not fut.done():
+                    fut.cancel()
+            raise
+
+
+_SOURCE_TYPE_BY_VALUE: dict[str, DbSourceType] = {t.value: t for t in DbSourceType}
+
+
 def _parse_source_type(v: Optional[str]) -> DbSourceType:
-    if not v:
-        return DbSourceType.CHANNEL
-    s = v.strip().lower()
-    for t in DbSourceType:
-        if t.value == s:
-            return t
-    return DbSourceType.CHANNEL
+    return _SOURCE_TYPE_BY_VALUE.get((v or "").strip().lower(), DbSourceType.CHANNEL)
+
+
+# Options models are immutable, so the defaults can be shared by every rule.
+_DEFAULT_KEYWORD_OPTIONS = KeywordOptions()
 
 
 def _safe_keyword_options(settings: Optional[dict[str, Any]]) -> KeywordOptions:
     if not settings:
-        return KeywordOptions()
+        return _DEFAULT_KEYWORD_OPTIONS
     try:
         return KeywordOptions(**settings)
     except Exception:
         logger.warning("Invalid keyword_options in filter.settings; using defaults")
-        return KeywordOptions()
+        return _DEFAULT_KEYWORD_OPTIONS
 
 
 def _safe_semantic_options(settings: Optional[dict[str, Any]], *, threshold: float) -> SemanticOptions:
-    base = SemanticOptions(threshold=threshold)
-    if not settings:
-        return base
-    try:
-        # Do not trust stored threshold; column is the source of truth.
-        tmp = SemanticOptions(**{**settings, "threshold": threshold})
-        return tmp
-    except Exception:
-        logger.warning("Invalid semantic_options in filter.settings; using defaults")
-        return base
+    if settings:
+        try:
+            # Do not trust stored threshold; column is the source of truth.
+            return SemanticOptions(**{**settings, "threshold": threshold})
+        except Exception:
+            logger.warning("Invalid semantic_options in filter.settings; using defaults")
+    return SemanticOptions(threshold=threshold)
+
+
+def _needs_semantic(rule: FilterRule) -> bool:
+    return rule.config.mode != FilterMode.KEYWORD_ONLY and bool(rule.config.topics)
+
+
+# Built rules keyed by (filter id, updated_at epoch): filters change rarely, so most
+# dispatches reuse the already-validated models instead of rebuilding them per message.
+_RULE_CACHE: dict[tuple[int, float], FilterRule] = {}
+_RULE_CACHE_MAX = 10_000
 
 
 def _db_filter_to_rule(db_filter: DbFilter) -> FilterRule:
+    if db_filter.updated_at is None:
+        return _build_rule(db_filter)
+
+    key = (int(db_filter.id), db_filter.updated_at.timestamp())
+    cached = _RULE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    rule = _build_rule(db_filter)
+
+    # Simple FIFO eviction to keep memory bounded.
+    if len(_RULE_CACHE) >= _RULE_CACHE_MAX:
+        first_key = next(iter(_RULE_CACHE))
+        del _RULE_CACHE[first_key]
+    _RULE_CACHE[key] = rule
+    return rule
+
+
+def _build_rule(db_filter: DbFilter) -> FilterRule:
     extra = db_filter.settings or {}
 
     kw_opts = _safe_keyword_options(extra.get("keyword_options"))
@@ -156,6 +272,50 @@ def _db_filter_to_rule(db_filter: DbFilter) -> FilterRule:
     )
 
 
+# Built active rules per user: user_id -> (expires_at monotonic, users.updated_at, rules).
+# FilterRepository bumps users.updated_at on every filter change, so entries are also
+# invalidated by changes made from another process (control bot) before the TTL expires.
+_USER_RULES_CACHE: dict[int, tuple[float, Optional[datetime], list[FilterRule]]] = {}
+_USER_RULES_CACHE_MAX = 10_000
+
+
+def invalidate_user_rules(user_id: Optional[int] = None) -> None:
+    """
+    Drop cached filter rules of a user (or of all users if user_id is None).
+
+    Args:
+        user_id: User ID to invalidate; None clears the whole cache
+    """
+    if user_id is None:
+        _USER_RULES_CACHE.clear()
+    else:
+        _USER_RULES_CACHE.pop(int(user_id), None)
+
+
+async def _forward_concurrently(
+    forwarder: Forwarder,
+    incoming: IncomingMessage,
+    forward_rows: list[dict[str, Any]],
+    *,
+    max_concurrency: int,
+) -> list[Any]:
+    """Forward to all targets, at most `max_concurrency` at a time; errors are returned, not raised."""
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _forward(to_chat_id: int) -> int:
+        async with semaphore:
+            return await forwarder.forward(
+                from_chat_id=incoming.chat_id,
+                telegram_message_id=incoming.telegram_message_id,
+                to_chat_id=to_chat_id,
+            )
+
+    return await asyncio.gather(
+        *(_forward(int(row["target_chat_id"])) for row in forward_rows),
+        return_exceptions=True,
+    )
+
+
 class Dispatcher:
     """Orchestrates message processing using DB repositories and filtering pipeline."""
 
@@ -164,6 +324,7 @@ class Dispatcher:
         *,
         session: AsyncSession,
         forwarder: Optional[Forwarder] = None,
+        normalizer: Optional[NormalizationBatcher] = None,
         user_repo: Optional[UserRepository] = None,
         source_repo: Optional[SourceRepository] = None,
         subscription_repo: Optional[SubscriptionRepository] = None,
@@ -174,6 +335,7 @@ class Dispatcher:
     ):
         self._session = session
         self._forwarder = forwarder
+        self._normalizer = normalizer
 
         self._users = user_repo or UserRepository(session)
         self._sources = source_repo or SourceRepository(session)
@@ -183,6 +345,39 @@ class Dispatcher:
         self._matches = match_repo or FilterMatchRepository(session)
         self._forwards = forwarded_repo or ForwardedMessageRepository(session)
 
+    async def _get_rules_for_users(self, users: list[DbUser]) -> dict[int, list[FilterRule]]:
+        """Return active rules per user, loading cache misses with a single query."""
+        ttl = get_settings().filter.user_rules_cache_ttl_seconds
+        now = time.monotonic()
+
+        rules_by_user: dict[int, list[FilterRule]] = {}
+        missing: list[int] = []
+        for user in users:
+            uid = int(user.id)
+            cached = _USER_RULES_CACHE.get(uid)
+            if cached is not None and cached[0] > now and cached[1] == user.updated_at:
+                rules_by_user[uid] = cached[2]
+            else:
+                missing.append(uid)
+
+        if not missing:
+            return rules_by_user
+
+        loaded: dict[int, list[FilterRule]] = {uid: [] for uid in missing}
+        for db_filter in await self._filters.get_active_filters_for_users(missing):
+            loaded[int(db_filter.user_id)].append(_db_filter_to_rule(db_filter))
+        rules_by_user.update(loaded)
+
+        if ttl > 0:
+            versions = {int(u.id): u.updated_at for u in users}
+            for uid, rules in loaded.items():
+                # Simple FIFO eviction to keep memory bounded.
+                if uid not in _USER_RULES_CACHE and len(_USER_RULES_CACHE) >= _USER_RULES_CACHE_MAX:
+                    del _USER_RULES_CACHE[next(iter(_USER_RULES_CACHE))]
+                _USER_RULES_CACHE[uid] = (now + ttl, versions[uid], rules)
+
+        return rules_by_user
+
     async def dispatch(self, incoming: IncomingMessage) -> DispatchResult:
         """Process a single incoming message."""
 
@@ -211,78 +406,85 @@ class Dispatcher:
             meta=incoming.metadata,
         )
 
-        # Normalization (prefer incoming if provided).
-        normalized = incoming.normalized_text
-        if normalized is None:
-            normalized = normalize_text(text)
-
-        # Find subscribers to this source.
+        # Find subscribers to this source (users are prefetched).
         subs: list[DbSubscription] = await self._subs.get_source_subscribers(int(source.id), active_only=True)
+        users: list[DbUser] = [sub.user for sub in subs if sub.user.is_active]
+        if not users:
+            await self._messages.mark_as_processed(int(msg.id))
+            return DispatchResult(
+                message_id=int(msg.id),
+                source_id=int(source.id),
+                matched_filters=[],
+                matches_created=0,
+                forwards_created=0,
+                forwards_sent=0,
+            )
+        rules_by_user = await self._get_rules_for_users(users)
 
-        matches_created = 0
-        forwards_created = 0
-        forwards_sent = 0
-        matched_filters: list[int] = []
-
-        for sub in subs:
-            user: Optional[DbUser] = getattr(sub, "user", None)
-            if user is None:
-                user = await self._users.get(int(sub.user_id))
-
-            if user is None or not user.is_active:
-                continue
+        # Normalization (prefer incoming if provided). The pipeline only uses it for
+        # semantic matching (keyword matching normalizes per filter options), so it is
+        # skipped when every rule is keyword-only, and lemmas are never needed.
+        normalized = incoming.normalized_text
+        if normalized is None and any(_needs_semantic(r) for rules in rules_by_user.values() for r in rules):
+            if self._normalizer is not None:
+                normalized = await self._normalizer.normalize(text)
+            else:
+                normalized = normalize_text(text, use_lemmatization=False)
 
-            # Load active filters for this user.
-            db_filters = await self._filters.get_user_filters(int(user.id), active_only=True)
-            rules = [_db_filter_to_rule(f) for f in db_filters if f.is_active]
+        matched_filters: list[int] = []
+        match_rows: list[dict[str, Any]] = []
+        forward_rows: list[dict[str, Any]] = []
 
+        for user in users:
             # Apply pipeline.
             results = run_pipeline(
                 text=text,
                 message_id=int(msg.id),
-                rules=rules,
+                rules=rules_by_user[int(user.id)],
                 normalized_text=normalized,
             )
 
             for res in results:
                 matched_filters.append(int(res.filter_id))
-
-                # Persist match.
-                db_match_type = DbMatchType(res.match_type.value)
-                _match, created = await self._matches.get_or_create_match(
-                    message_id=int(msg.id),
-                    filter_id=int(res.filter_id),
-                    match_type=db_match_type,
-                    score=float(res.score),
-                    details=res.details,
+                match_rows.append(
+                    {
+                        "message_id": int(msg.id),
+                        "filter_id": int(res.filter_id),
+                        "match_type": DbMatchType(res.match_type.value),
+                        "score": float(res.score),
+                        "details": res.details,
+                    }
                 )
-                if created:
-                    matches_created += 1
 
-                # Create forwarding record and (optionally) forward immediately.
                 if user.target_chat_id is None:
                     continue
 
-                fw = await self._forwards.create(
-                    user_id=int(user.id),
-                    filter_id=int(res.filter_id),
-                    message_id=int(msg.id),
-                    target_chat_id=int(user.target_chat_id),
-                    status=ForwardedStatus.PENDING,
+                forward_rows.append(
+                    {
+                        "user_id": int(user.id),
+                        "filter_id": int(res.filter_id),
+                        "message_id": int(msg.id),
+                        "target_chat_id": int(user.target_chat_id),
+                        "status": ForwardedStatus.PENDING,
+                    }
                 )
-                forwards_created += 1
-
-                if self._forwarder is not None:
-                    try:
-                        forwarded_telegram_message_id = await self._forwarder.forward(
-                            from_chat_id=incoming.chat_id,
-                            telegram_message_id=incoming.telegram_message_id,
-                            to_chat_id=int(user.target_chat_id),
-                        )
-                        await self._forwards.mark_as_sent(int(fw.id), int(forwarded_telegram_message_id))
-                        forwards_sent += 1
-                    except Exception as e:
-                        await self._forwards.mark_as_failed(int(fw.id), str(e))
+
+        # Persist matches and forwarding records in bulk (one statement each).
+        created_match_ids = await self._matches.bulk_create(match_rows)
+        forward_ids = await self._forwards.bulk_create(forward_rows)
+
+        # Forward concurrently; status updates stay sequential on the shared session.
+        forwards_sent = 0
+        if self._forwarder is not None and forward_ids:
+            outcomes = await _forward_concurrently(
+                self._forwarder, incoming, forward_rows, max_concurrency=settings.filter.max_concurrent_subs
+            )
+            for fw_id, outcome in zip(forward_ids, outcomes, strict=True):
+                if isinstance(outcome, BaseException):
+                    await self._forwards.mark_as_failed(int(fw_id), str(outcome))
+                else:
+                    await self._forwards.mark_as_sent(int(fw_id), int(outcome))
+                    forwards_sent += 1
 
         # Mark processed (even if no matches).
         await self._messages.mark_as_processed(int(msg.id))
@@ -291,7 +493,7 @@ class Dispatcher:
             message_id=int(msg.id),
             source_id=int(source.id),
             matched_filters=matched_filters,
-            matches_created=matches_created,
-            forwards_created=forwards_created,
+            matches_created=len(created_match_ids),
+            forwards_created=len(forward_ids),
             forwards_sent=forwards_sent,
         )
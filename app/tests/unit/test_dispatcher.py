@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+import app.routing.dispatcher as dispatcher_mod
+from app.domain.entities import FilterMode
+from app.infra.db.models import SourceType as DbSourceType
+from app.nlp.preprocess import normalize_text
+from app.routing.dispatcher import (
+    Dispatcher,
+    IncomingMessage,
+    NormalizationBatcher,
+    _db_filter_to_rule,
+    _forward_concurrently,
+    _parse_source_type,
+    invalidate_user_rules,
+)
+
+
+def _db_filter(**overrides):
+    data = {
+        "id": 1,
+        "user_id": 10,
+        "name": "f",
+        "is_active": True,
+        "mode": FilterMode.KEYWORD_ONLY,
+        "keywords": ["python"],
+        "topics": [],
+        "semantic_threshold": 0.7,
+        "settings": {},
+        "created_at": datetime(2025, 1, 1),
+        "updated_at": datetime(2025, 1, 1),
+    }
+    data.update(overrides)
+    return SimpleNamespace(**data)
+
+
+class _FakeRepos:
+    """In-memory stand-ins for the repositories used by Dispatcher."""
+
+    def __init__(self, *, subs: list, filters_by_user: dict[int, list]):
+        self.subs = subs
+        self.filters_by_user = filters_by_user
+        self.filter_loads: list[list[int]] = []
+        self.match_rows: list[dict] = []
+        self.forward_rows: list[dict] = []
+        self.sent: list[tuple[int, int]] = []
+        self.failed: list[tuple[int, str]] = []
+        self.processed: list[int] = []
+
+    # SourceRepository
+    async def get_by_telegram_chat_id(self, chat_id: int):
+        return SimpleNamespace(id=100)
+
+    # MessageRepository
+    async def get_or_create_message(self, **kwargs):
+        return SimpleNamespace(id=500), True
+
+    async def mark_as_processed(self, message_id: int):
+        self.processed.append(message_id)
+
+    # SubscriptionRepository
+    async def get_source_subscribers(self, source_id: int, active_only: bool = True):
+        return self.subs
+
+    # FilterRepository
+    async def get_active_filters_for_users(self, user_ids: list[int]):
+        self.filter_loads.append(list(user_ids))
+        return [f for uid in user_ids for f in self.filters_by_user.get(uid, [])]
+
+    # FilterMatchRepository / ForwardedMessageRepository
+    async def bulk_create(self, rows: list[dict]):
+        target = self.forward_rows if rows and "target_chat_id" in rows[0] else self.match_rows
+        start = len(target)
+        target.extend(rows)
+        return list(range(start + 1, start + 1 + len(rows)))
+
+    async def mark_as_sent(self, forwarded_id: int, forwarded_telegram_message_id: int):
+        self.sent.append((forwarded_id, forwarded_telegram_message_id))
+
+    async def mark_as_failed(self, forwarded_id: int, error_message: str):
+        self.failed.append((forwarded_id, error_message))
+
+
+class _FakeForwarder:
+    def __init__(self, fail_chat_ids: set[int]):
+        self.fail_chat_ids = fail_chat_ids
+
+    async def forward(self, *, from_chat_id: int, telegram_message_id: int, to_chat_id: int) -> int:
+        if to_chat_id in self.fail_chat_ids:
+            raise RuntimeError("forbidden")
+        return to_chat_id * 10
+
+
+def _user(user_id: int, *, target_chat_id, is_active: bool = True):
+    return SimpleNamespace(
+        id=user_id, is_active=is_active, target_chat_id=target_chat_id, updated_at=datetime(2025, 1, 1)
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_rule_caches():
+    # Built rules are keyed by (filter id, updated_at) and `_db_filter` defaults both,
+    # so the module-level rule cache is cleared too, not only the per-user one.
+    invalidate_user_rules()
+    dispatcher_mod._RULE_CACHE.clear()
+    yield
+    invalidate_user_rules()
+    dispatcher_mod._RULE_CACHE.clear()
+
+
+def _make_dispatcher(repos: _FakeRepos, forwarder=None) -> Dispatcher:
+    return Dispatcher(
+        session=None,  # type: ignore[arg-type]
+        forwarder=forwarder,
+        user_repo=repos,  # type: ignore[arg-type]
+        source_repo=repos,  # type: ignore[arg-type]
+        subscription_repo=repos,  # type: ignore[arg-type]
+        filter_repo=repos,  # type: ignore[arg-type]
+        message_repo=repos,  # type: ignore[arg-type]
+        match_repo=repos,  # type: ignore[arg-type]
+        forwarded_repo=repos,  # type: ignore[arg-type]
+    )
+
+
+class TestDispatch:
+    async def test_dispatch_persists_and_forwards_in_bulk(self) -> None:
+        users = [
+            _user(10, target_chat_id=1001),
+            _user(11, target_chat_id=1002),
+            _user(12, target_chat_id=None),
+            _user(13, target_chat_id=1003, is_active=False),
+        ]
+        repos = _FakeRepos(
+            subs=[SimpleNamespace(user_id=u.id, user=u) for u in users],
+            filters_by_user={uid: [_db_filter(id=uid + 11, user_id=uid)] for uid in (10, 11, 12, 13)},
+        )
+        dispatcher = _make_dispatcher(repos, forwarder=_FakeForwarder(fail_chat_ids={1002}))
+
+        result = await dispatcher.dispatch(
+            IncomingMessage(telegram_message_id=7, chat_id=-100, date=datetime(2025, 1, 1), text="python news")
+        )
+
+        assert sorted(result.matched_filters) == [21, 22, 23]
+        assert result.matches_created == 3
+        assert result.forwards_created == 2
+        assert result.forwards_sent == 1
+        assert [r["filter_id"] for r in repos.match_rows] == [21, 22, 23]
+        assert [r["target_chat_id"] for r in repos.forward_rows] == [1001, 1002]
+        assert repos.sent == [(1, 10010)]
+        assert repos.failed == [(2, "forbidden")]
+        assert repos.processed == [500]
+        assert repos.filter_loads == [[10, 11, 12]]
+
+    async def test_dispatch_without_subscribers_returns_early(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fail_normalize(*args, **kwargs):
+            raise AssertionError("normalization must be skipped")
+
+        monkeypatch.setattr(dispatcher_mod, "normalize_text", fail_normalize)
+        repos = _FakeRepos(subs=[], filters_by_user={})
+        result = await _make_dispatcher(repos).dispatch(
+            IncomingMessage(telegram_message_id=7, chat_id=-100, date=datetime(2025, 1, 1), text="python")
+        )
+
+        assert result.matched_filters == []
+        assert repos.filter_loads == []
+        assert repos.processed == [500]
+
+    async def test_normalization_only_for_semantic_rules(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[dict] = []
+
+        def spy_normalize(text: str, **kwargs):
+            calls.append(kwargs)
+            return normalize_text(text, **kwargs)
+
+        monkeypatch.setattr(dispatcher_mod, "normalize_text", spy_normalize)
+        monkeypatch.setattr(dispatcher_mod, "run_pipeline", lambda **kwargs: [])
+        user = _user(10, target_chat_id=None)
+        repos = _FakeRepos(
+            subs=[SimpleNamespace(user_id=10, user=user)],
+            filters_by_user={10: [_db_filter(id=21, user_id=10)]},
+        )
+        incoming = IncomingMessage(telegram_message_id=7, chat_id=-100, date=datetime(2025, 1, 1), text="python")
+
+        await _make_dispatcher(repos).dispatch(incoming)
+        assert calls == []
+
+        invalidate_user_rules()
+        repos.filters_by_user[10].append(
+            _db_filter(id=99, user_id=10, mode=FilterMode.SEMANTIC_ONLY, keywords=[], topics=["tech"])
+        )
+        await _make_dispatcher(repos).dispatch(incoming)
+        assert calls == [{"use_lemmatization": False}]
+
+    async def test_user_rules_are_cached_until_user_version_changes(self) -> None:
+        user = _user(10, target_chat_id=None)
+        repos = _FakeRepos(
+            subs=[SimpleNamespace(user_id=10, user=user)],
+            filters_by_user={10: [_db_filter(id=21, user_id=10)]},
+        )
+        dispatcher = _make_dispatcher(repos)
+        incoming = IncomingMessage(telegram_message_id=7, chat_id=-100, date=datetime(2025, 1, 1), text="python")
+
+        await dispatcher.dispatch(incoming)
+        await dispatcher.dispatch(incoming)
+        assert repos.filter_loads == [[10]]
+
+        # A filter change bumps users.updated_at, which invalidates the entry.
+        user.updated_at = datetime(2025, 1, 2)
+        result = await dispatcher.dispatch(incoming)
+        assert repos.filter_loads == [[10], [10]]
+        assert result.matched_filters == [21]
+
+        invalidate_user_rules(10)
+        await dispatcher.dispatch(incoming)
+        assert len(repos.filter_loads) == 3
+
+
+class TestForwardConcurrently:
+    async def test_concurrency_is_bounded(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        class _SlowForwarder:
+            async def forward(self, *, from_chat_id: int, telegram_message_id: int, to_chat_id: int) -> int:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                if to_chat_id == 3:
+                    raise RuntimeError("blocked")
+                return to_chat_id
+
+        incoming = IncomingMessage(telegram_message_id=7, chat_id=-100, date=datetime(2025, 1, 1))
+        rows = [{"target_chat_id": i} for i in range(6)]
+        outcomes = await _forward_concurrently(_SlowForwarder(), incoming, rows, max_concurrency=2)
+
+        assert peak == 2
+        assert [o for i, o in enumerate(outcomes) if i != 3] == [0, 1, 2, 4, 5]
+        assert isinstance(outcomes[3], RuntimeError)
+
+
+class TestParseSourceType:
+    def test_known_and_fallback_values(self) -> None:
+        assert _parse_source_type(" Group ") == DbSourceType.GROUP
+        assert _parse_source_type("private") == DbSourceType.PRIVATE
+        assert _parse_source_type("supergroup") == DbSourceType.CHANNEL
+        assert _parse_source_type(None) == DbSourceType.CHANNEL
+
+
+class TestDbFilterToRule:
+    def test_rule_is_reused_until_filter_changes(self) -> None:
+        first = _db_filter_to_rule(_db_filter())
+        assert _db_filter_to_rule(_db_filter()) is first
+
+        changed = _db_filter_to_rule(_db_filter(keywords=["java"], updated_at=datetime(2025, 1, 2)))
+        assert changed is not first
+        assert changed.config.keywords == ["java"]
+
+    def test_options_from_settings_are_validated(self) -> None:
+        rule = _db_filter_to_rule(
+            _db_filter(
+                id=3,
+                semantic_threshold=0.4,
+                settings={
+                    "keyword_options": {"whole_word": "true"},
+                    "semantic_options": {"threshold": 0.9, "use_cached_embeddings": False},
+                },
+            )
+        )
+        assert rule.config.keyword_options.whole_word is True
+        assert rule.config.semantic_options.threshold == 0.4
+        assert rule.config.semantic_options.use_cached_embeddings is False
+
+        broken = _db_filter_to_rule(
+            _db_filter(id=4, settings={"keyword_options": {"min_keyword_length": 0}})
+        )
+        assert broken.config.keyword_options == _db_filter_to_rule(_db_filter(id=5)).config.keyword_options
+
+    def test_rule_without_updated_at_is_not_cached(self) -> None:
+        first = _db_filter_to_rule(_db_filter(id=2, updated_at=None))
+        assert _db_filter_to_rule(_db_filter(id=2, updated_at=None)) is not first
+
+
+class TestNormalizationBatcher:
+    async def test_concurrent_texts_are_batched(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[list[str]] = []
+
+        def fake_batch(texts: list[str], **kwargs):
+            calls.append(list(texts))
+            return [normalize_text(t, use_lemmatization=False) for t in texts]
+
+        monkeypatch.setattr(dispatcher_mod, "normalize_text_batch", fake_batch)
+
+        batcher = NormalizationBatcher(max_batch_size=8)
+        try:
+            texts = ["first message", "second message", "third message"]
+            results = await asyncio.gather(*(batcher.normalize(t) for t in texts))
+        finally:
+            await batcher.stop()
+
+        assert calls == [texts]
+        assert [r.original for r in results] == texts
+        assert results[1].tokens == ["second", "message"]
+
+    async def test_batch_error_propagates(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def failing_batch(texts: list[str], **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(dispatcher_mod, "normalize_text_batch", failing_batch)
+
+        batcher = NormalizationBatcher()
+        try:
+            with pytest.raises(RuntimeError, match="boom"):
+                await batcher.normalize("text")
+        finally:
+            await batcher.stop()
+
+    async def test_short_batch_result_fails_callers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def short_batch(texts: list[str], **kwargs):
+            return [normalize_text(texts[0], use_lemmatization=False)]
+
+        monkeypatch.setattr(dispatcher_mod, "normalize_text_batch", short_batch)
+
+        batcher = NormalizationBatcher()
+        try:
+            first, second = await asyncio.wait_for(
+                asyncio.gather(
+                    batcher.normalize("first"), batcher.normalize("second"), return_exceptions=True
+                ),
+                timeout=1,
+            )
+        finally:
+            await batcher.stop()
+
+        assert first.original == "first"
+        assert isinstance(second, ValueError)
+
+    async def test_stop_cancels_batch_in_flight(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_batch(texts: list[str], **kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return [normalize_text(t, use_lemmatization=False) for t in texts]
+
+        monkeypatch.setattr(dispatcher_mod, "normalize_text_batch", blocking_batch)
+
+        batcher = NormalizationBatcher(use_lemmatization=True)
+        task = asyncio.create_task(batcher.normalize("text"))
+        try:
+            await asyncio.to_thread(started.wait, 5)
+            await batcher.stop()
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(task, timeout=1)
+        finally:
+            release.set()
@@ -7,18 +7,43 @@ We therefore replace `SentenceTransformer` with a small deterministic fake.
 
 from __future__ import annotations
 
+import functools
+
 import numpy as np
 import pytest
 
 import app.nlp.embeddings as embeddings
 
 
+_FAKE_DIM = 8
+
+
+@functools.lru_cache(maxsize=2048)
+def _to_bytes_arr(text: str) -> np.ndarray:
+    """
+    First 256 UTF-8 bytes of `text` as a zero-padded float32 row (memoized; read-only).
+
+    Being a pure function of its argument, the memo is shared by all tests in the module.
+    """
+    raw = np.zeros(256, dtype=np.float32)
+    b = np.frombuffer(text.encode("utf-8")[:256], dtype=np.uint8)
+    raw[: b.size] = b
+    raw.flags.writeable = False
+    return raw
+
+
+# Byte i (of the first 256) is added to component i % dim, so the fake encoder is a linear
+# projection: (N, 256) padded bytes @ _PROJ -> (N, dim).
+_PROJ = np.zeros((256, _FAKE_DIM), dtype=np.float32)
+_PROJ[np.arange(256), np.arange(256) % _FAKE_DIM] = 1.0
+
+
 class _FakeSentenceTransformer:
     def __init__(self, model_name: str):
         self.model_name = model_name
 
     def get_sentence_embedding_dimension(self) -> int:
-        return 8
+        return _FAKE_DIM
 
     def encode(
         self,
@@ -28,30 +53,40 @@ class _FakeSentenceTransformer:
         show_progress_bar: bool = False,
         convert_to_numpy: bool = True,
     ) -> np.ndarray:
-        # Deterministic pseudo-embedding from text bytes.
-        def vec(s: str) -> np.ndarray:
-            raw = np.frombuffer(s.encode("utf-8"), dtype=np.uint8)
-            v = np.zeros(self.get_sentence_embedding_dimension(), dtype=np.float32)
-            for i, b in enumerate(raw[:256]):
-                v[i % v.size] += float(b)
-            if normalize_embeddings:
-                n = float(np.linalg.norm(v))
-                if n > 0:
-                    v = v / n
-            return v
-
-        arr = np.stack([vec(t) for t in texts], axis=0)
+        raw = np.empty((len(texts), 256), dtype=np.float32)
+        for i, t in enumerate(texts):
+            raw[i] = _to_bytes_arr(t)
+        arr = raw @ _PROJ
+        if normalize_embeddings:
+            # One norm over all rows; all-zero rows are left as they are.
+            norms = np.linalg.norm(arr, axis=1, keepdims=True)
+            np.divide(arr, np.where(norms > 0, norms, 1.0), out=arr)
         return arr if convert_to_numpy else arr.tolist()
 
 
-@pytest.fixture(autouse=True)
-def _patch_sentence_transformer(monkeypatch: pytest.MonkeyPatch) -> None:
-    # Ensure tests do not download real models.
-    monkeypatch.setattr(embeddings, "SentenceTransformer", _FakeSentenceTransformer)
-    embeddings.EmbeddingModel._instance = None
+@pytest.fixture(autouse=True, scope="module")
+def _patch_sentence_transformer():
+    # Ensure tests do not download real models. Patched once for the whole module;
+    # tests that depend on a fresh model or an empty cache request the fixtures below.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(embeddings, "SentenceTransformer", _FakeSentenceTransformer)
+        embeddings.reset_embedding_model()
+        embeddings.clear_embedding_cache()
+        yield
+    embeddings.reset_embedding_model()
     embeddings.clear_embedding_cache()
 
 
+@pytest.fixture
+def _clear_cache() -> None:
+    embeddings.clear_embedding_cache()
+
+
+@pytest.fixture
+def _fresh_model() -> None:
+    embeddings.reset_embedding_model()
+
+
 def test_encode_text_returns_vector() -> None:
     v = embeddings.encode_text("hello", use_cache=False)
     assert isinstance(v, np.ndarray)
@@ -64,8 +99,8 @@ def test_encode_texts_returns_matrix() -> None:
     assert m.shape == (3, embeddings.get_embedding_model().embedding_dimension)
 
 
+@pytest.mark.usefixtures("_clear_cache")
 def test_cache_grows_and_hits() -> None:
-    embeddings.clear_embedding_cache()
     assert embeddings.get_cache_size() == 0
 
     v1 = embeddings.encode_text("cached", use_cache=True)
@@ -73,11 +108,11 @@ def test_cache_grows_and_hits() -> None:
 
     v2 = embeddings.encode_text("cached", use_cache=True)
     assert embeddings.get_cache_size() == 1
-    assert np.allclose(v1, v2)
+    assert v1 is v2
 
 
+@pytest.mark.usefixtures("_clear_cache")
 def test_encode_texts_cached_caches_per_text() -> None:
-    embeddings.clear_embedding_cache()
     arr = embeddings.encode_texts_cached(["x", "y", "x"], normalize=True)
     assert arr.shape[0] == 3
     # two unique texts
@@ -103,6 +138,7 @@ def test_compute_similarities_batch() -> None:
     assert sims[1] == pytest.approx(0.0)
 
 
+@pytest.mark.usefixtures("_fresh_model")
 def test_preload_model_loads_fake_model() -> None:
     model = embeddings.get_embedding_model()
     assert model._model is None
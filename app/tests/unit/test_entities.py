@@ -4,6 +4,8 @@ Unit tests for domain entities.
 Tests validation, creation, and behavior of domain entity models.
 """
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 from pydantic import ValidationError
 
@@ -76,72 +78,46 @@ class TestSemanticOptions:
 class TestFilterConfig:
     """Tests for FilterConfig."""
 
-    def test_keyword_only_config(self) -> None:
-        """Test keyword-only filter configuration."""
-        config = FilterConfig(
-            mode=FilterMode.KEYWORD_ONLY,
-            keywords=["python", "programming"],
-        )
-        assert config.mode == FilterMode.KEYWORD_ONLY
-        assert len(config.keywords) == 2
-        assert config.topics == []
-
-        # Should validate successfully
-        config.validate_for_mode()
-
-    def test_semantic_only_config(self) -> None:
-        """Test semantic-only filter configuration."""
-        config = FilterConfig(
-            mode=FilterMode.SEMANTIC_ONLY,
-            topics=["technology", "science"],
-        )
-        assert config.mode == FilterMode.SEMANTIC_ONLY
-        assert len(config.topics) == 2
-        assert config.keywords == []
-
-        # Should validate successfully
-        config.validate_for_mode()
-
-    def test_combined_config(self) -> None:
-        """Test combined filter configuration."""
-        config = FilterConfig(
-            mode=FilterMode.COMBINED,
-            keywords=["python"],
-            topics=["programming"],
-        )
-        assert config.mode == FilterMode.COMBINED
-        assert len(config.keywords) == 1
-        assert len(config.topics) == 1
+    @pytest.mark.parametrize(
+        ("mode", "kwargs", "n_keywords", "n_topics"),
+        [
+            (FilterMode.KEYWORD_ONLY, {"keywords": ["python", "programming"]}, 2, 0),
+            (FilterMode.SEMANTIC_ONLY, {"topics": ["technology", "science"]}, 0, 2),
+            (FilterMode.COMBINED, {"keywords": ["python"], "topics": ["programming"]}, 1, 1),
+        ],
+        ids=["keyword_only", "semantic_only", "combined"],
+    )
+    def test_valid_config(
+        self, mode: FilterMode, kwargs: dict, n_keywords: int, n_topics: int
+    ) -> None:
+        """Test that each mode accepts a configuration with the data it needs."""
+        config = FilterConfig(mode=mode, **kwargs)
+        assert config.mode == mode
+        assert len(config.keywords) == n_keywords
+        assert len(config.topics) == n_topics
 
         # Should validate successfully
         config.validate_for_mode()
 
-    def test_validation_keyword_only_without_keywords(self) -> None:
-        """Test that keyword-only mode without keywords fails validation."""
-        config = FilterConfig(
-            mode=FilterMode.KEYWORD_ONLY,
-            keywords=[],
-        )
-        with pytest.raises(ValueError, match="Keywords are required"):
-            config.validate_for_mode()
-
-    def test_validation_semantic_only_without_topics(self) -> None:
-        """Test that semantic-only mode without topics fails validation."""
-        config = FilterConfig(
-            mode=FilterMode.SEMANTIC_ONLY,
-            topics=[],
-        )
-        with pytest.raises(ValueError, match="Topics are required"):
-            config.validate_for_mode()
-
-    def test_validation_combined_without_keywords_or_topics(self) -> None:
-        """Test that combined mode without keywords or topics fails validation."""
-        config = FilterConfig(
-            mode=FilterMode.COMBINED,
-            keywords=[],
-            topics=[],
-        )
-        with pytest.raises(ValueError, match="Either keywords or topics must be provided"):
+    @pytest.mark.parametrize(
+        ("mode", "kwargs", "error"),
+        [
+            (FilterMode.KEYWORD_ONLY, {"keywords": []}, "Keywords are required"),
+            (FilterMode.SEMANTIC_ONLY, {"topics": []}, "Topics are required"),
+            (
+                FilterMode.COMBINED,
+                {"keywords": [], "topics": []},
+                "Either keywords or topics must be provided",
+            ),
+        ],
+        ids=["keyword_only", "semantic_only", "combined"],
+    )
+    def test_validation_fails_without_required_data(
+        self, mode: FilterMode, kwargs: dict, error: str
+    ) -> None:
+        """Test that a mode without the keywords/topics it needs fails validation."""
+        config = FilterConfig(mode=mode, **kwargs)
+        with pytest.raises(ValueError, match=error):
             config.validate_for_mode()
 
     def test_empty_strings_removed(self) -> None:
@@ -240,6 +216,13 @@ class TestNormalizedText:
         )
         assert text.lemmas == ["run", "quickly"]
 
+    def test_immutable_and_slotted(self) -> None:
+        """Test normalized text cannot be modified and has no instance dict."""
+        text = NormalizedText(original="test", normalized="test", tokens=["test"])
+        with pytest.raises(FrozenInstanceError):
+            text.normalized = "other"  # type: ignore[misc]
+        assert not hasattr(text, "__dict__")
+
 
 class TestKeywordMatch:
     """Tests for KeywordMatch."""
@@ -9,6 +9,7 @@ import pytest
 from app.domain.entities import (
     FilterConfig,
     FilterMode,
+    KeywordMatch,
     KeywordOptions,
     Language,
     NormalizedText,
@@ -19,6 +20,7 @@ from app.filters.keyword_matcher import (
     evaluate_filter_keywords,
     get_match_score,
     highlight_keywords,
+    keyword_match_satisfies_filter,
     match_filter_keywords,
     match_keyword_in_tokens,
     match_keyword_simple,
@@ -238,6 +240,26 @@ class TestMatchKeywordsInText:
         # token-based strategy counts presence per keyword (not occurrences)
         assert token_match.match_count == 1
 
+    def test_partial_matching_same_with_and_without_automaton(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Aho-Corasick scan and per-keyword fallback must report identical matches."""
+        import app.filters.keyword_matcher as km
+
+        text = "Ananas and banana: nanana, PYTHON"
+        keywords = ["ana", "nana", "python", "java"]
+        options = KeywordOptions(whole_word=False, use_lemmatization=False)
+
+        with_automaton = match_keywords_in_text(text, keywords, options=options)
+
+        monkeypatch.setattr(km, "_AHOCORASICK", None)
+        monkeypatch.setattr(km, "_AHOCORASICK_CHECKED", True)
+        without_automaton = match_keywords_in_text(text, keywords, options=options)
+
+        assert with_automaton == without_automaton
+        assert with_automaton.matched_keywords == ["ana", "nana", "python"]
+        assert with_automaton.positions["nana"] == [1, 13, 18, 20]
+
 
 class TestMatchFilterKeywords:
     """Tests for filter-based keyword matching."""
@@ -333,7 +355,7 @@ class TestEvaluateFilterKeywords:
         assert evaluate_filter_keywords(text, config) is True
 
         # Should not match because not all keywords are present
-        config.keywords = ["python", "java"]
+        config = config.model_copy(update={"keywords": ["python", "java"]})
         assert evaluate_filter_keywords(text, config) is False
 
     def test_no_keywords(self) -> None:
@@ -347,75 +369,94 @@ class TestEvaluateFilterKeywords:
 
         assert evaluate_filter_keywords(text, config) is False
 
+    def test_existing_match_gives_same_verdict(self) -> None:
+        """Test that an already computed match yields the evaluate_filter_keywords verdict."""
+        text = "Python programming language"
+        for keywords, require_all in (
+            (["python", "java"], False),
+            (["python", "programming"], True),
+            (["python", "java"], True),
+            (["ruby"], False),
+        ):
+            config = FilterConfig(
+                mode=FilterMode.KEYWORD_ONLY,
+                keywords=keywords,
+                require_all_keywords=require_all,
+            )
+            match = match_filter_keywords(text, config)
+            assert keyword_match_satisfies_filter(match, config) is evaluate_filter_keywords(
+                text, config
+            )
+
+
+@pytest.fixture(scope="module")
+def empty_match() -> KeywordMatch:
+    return KeywordMatch()
+
+
+@pytest.fixture(scope="module")
+def single_match() -> KeywordMatch:
+    return KeywordMatch(matched_keywords=["python"], match_count=1, positions={})
+
+
+@pytest.fixture(scope="module")
+def multi_match() -> KeywordMatch:
+    return KeywordMatch(matched_keywords=["python", "programming"], match_count=5, positions={})
+
 
 class TestGetMatchScore:
     """Tests for match score calculation."""
 
-    def test_no_match_score(self) -> None:
+    def test_no_match_score(self, empty_match: KeywordMatch) -> None:
         """Test score for no matches."""
-        from app.domain.entities import KeywordMatch
-
-        match = KeywordMatch()
-        score = get_match_score(match)
+        score = get_match_score(empty_match)
         assert score == 0.0
 
-    def test_single_match_score(self) -> None:
+    def test_single_match_score(self, single_match: KeywordMatch) -> None:
         """Test score for single match."""
-        from app.domain.entities import KeywordMatch
-
-        match = KeywordMatch(matched_keywords=["python"], match_count=1)
-        score = get_match_score(match)
+        score = get_match_score(single_match)
         assert 0.0 < score <= 1.0
 
-    def test_multiple_matches_score(self) -> None:
+    def test_multiple_matches_score(self, multi_match: KeywordMatch) -> None:
         """Test score for multiple matches."""
-        from app.domain.entities import KeywordMatch
-
-        match = KeywordMatch(
-            matched_keywords=["python", "programming"], match_count=5, positions={}
-        )
-        score = get_match_score(match)
+        score = get_match_score(multi_match)
         assert 0.0 < score <= 1.0
 
 
 class TestHighlightKeywords:
     """Tests for keyword highlighting."""
 
-    def test_basic_highlighting(self) -> None:
+    def test_basic_highlighting(self, multi_match: KeywordMatch) -> None:
         """Test basic keyword highlighting."""
-        from app.domain.entities import KeywordMatch
-
         text = "Python is a programming language"
-        match = KeywordMatch(
-            matched_keywords=["python", "programming"],
-            match_count=2,
-            positions={},
-        )
 
-        highlighted = highlight_keywords(text, match)
+        highlighted = highlight_keywords(text, multi_match)
         assert "**Python**" in highlighted or "**python**" in highlighted
         assert "**programming**" in highlighted
 
-    def test_no_match_highlighting(self) -> None:
+    def test_no_match_highlighting(self, empty_match: KeywordMatch) -> None:
         """Test highlighting with no matches."""
-        from app.domain.entities import KeywordMatch
-
         text = "Python programming"
-        match = KeywordMatch()
 
-        highlighted = highlight_keywords(text, match)
+        highlighted = highlight_keywords(text, empty_match)
         assert highlighted == text
 
-    def test_custom_highlight_format(self) -> None:
+    def test_custom_highlight_format(self, single_match: KeywordMatch) -> None:
         """Test highlighting with custom format."""
-        from app.domain.entities import KeywordMatch
-
         text = "Python programming"
-        match = KeywordMatch(matched_keywords=["python"], match_count=1, positions={})
 
-        highlighted = highlight_keywords(text, match, highlight_format="<mark>{keyword}</mark>")
+        highlighted = highlight_keywords(
+            text, single_match, highlight_format="<mark>{keyword}</mark>"
+        )
         assert "<mark>Python</mark>" in highlighted or "<mark>python</mark>" in highlighted
 
+    def test_overlapping_keywords_highlighted_once(self) -> None:
+        """Test that a keyword inside a longer matched keyword is not highlighted twice."""
+        match = KeywordMatch(matched_keywords=["on", "python"], match_count=2, positions={})
+
+        highlighted = highlight_keywords("Python on rails", match)
+        assert highlighted == "**Python** **on** rails"
+
 
 class TestRussianKeywordMatching:
     """Tests for Russian keyword matching."""
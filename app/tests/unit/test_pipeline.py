@@ -11,6 +11,8 @@ Semantic part is tested in offline/mock mode by monkeypatching embedding functio
 
 from __future__ import annotations
 
+import functools
+
 import numpy as np
 import pytest
 
@@ -19,146 +21,156 @@ from app.domain.entities import FilterConfig, FilterMode, FilterRule, Normalized
 from app.filters.pipeline import run_pipeline
 
 
-def _unit(v: np.ndarray) -> np.ndarray:
-    n = float(np.linalg.norm(v))
-    return v if n == 0 else v / n
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
 
 
-def _embed_3d(text: str) -> np.ndarray:
-    t = (text or "").lower()
-    # 3 dimensions: python/programming, cooking/food, physics/science
-    v = np.array(
-        [
-            1.0 if any(k in t for k in ("python", "program", "код")) else 0.0,
-            1.0 if any(k in t for k in ("cook", "food", "еда", "паста")) else 0.0,
-            1.0 if any(k in t for k in ("phys", "quant", "наука", "атом")) else 0.0,
-        ],
-        dtype=np.float32,
-    )
-    # if nothing matched, make it a small distinct vector so similarities are low
-    if float(v.sum()) == 0.0:
-        v = np.array([0.1, 0.1, 0.1], dtype=np.float32)
-    return _unit(v)
+# 3 dimensions: python/programming, cooking/food, physics/science
+_DIM_KEYWORDS: tuple[tuple[str, ...], ...] = (
+    ("python", "program", "код"),
+    ("cook", "food", "еда", "паста"),
+    ("phys", "quant", "наука", "атом"),
+)
 
 
-@pytest.fixture(autouse=True)
-def _patch_embeddings(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_encode_text(text: str, use_cache: bool = True, normalize: bool = True) -> np.ndarray:
-        v = _embed_3d(text)
-        return v if normalize else v
+def _build_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for dim, keywords in enumerate(_DIM_KEYWORDS):
+        for keyword in keywords:
+            automaton.add_word(keyword, dim)
+    automaton.make_automaton()
+    return automaton
 
-    def fake_encode_texts(
-        texts: list[str],
-        batch_size: int = 32,
-        normalize: bool = True,
-        show_progress: bool = False,
-    ) -> np.ndarray:
-        arr = np.stack([_embed_3d(t) for t in texts], axis=0)
-        return arr if normalize else arr
 
-    def fake_encode_texts_cached(texts: list[str], normalize: bool = True) -> np.ndarray:
-        arr = np.stack([_embed_3d(t) for t in texts], axis=0)
-        return arr if normalize else arr
+_AUTOMATON = _build_automaton()
 
-    monkeypatch.setattr(sm, "encode_text", fake_encode_text)
-    monkeypatch.setattr(sm, "encode_texts", fake_encode_texts)
-    monkeypatch.setattr(sm, "encode_texts_cached", fake_encode_texts_cached)
 
+def _unit_vectors() -> np.ndarray:
+    # Row `mask` is the unit vector for the set of matched dimensions (bit d = dimension d).
+    # If nothing matched, use a small distinct vector so similarities are low.
+    table = np.full((8, 3), 0.1, dtype=np.float32)
+    for mask in range(1, 8):
+        table[mask] = [float(mask >> d & 1) for d in range(3)]
+    table /= np.linalg.norm(table, axis=1, keepdims=True)
+    table.flags.writeable = False
+    return table
 
-def _norm(text: str) -> NormalizedText:
-    # Minimal normalization for semantic matcher usage.
-    return NormalizedText(
-        original=text,
-        normalized=(text or "").lower(),
-        tokens=(text or "").lower().split(),
-        language="en",
-    )
 
+_UNIT_BY_MASK = _unit_vectors()
 
-def test_pipeline_no_matches() -> None:
-    text = "Cooking pasta for dinner"
-    rules = [
-        FilterRule(
-            id=1,
-            user_id=10,
-            name="combined",
-            config=FilterConfig(
-                mode=FilterMode.COMBINED,
-                keywords=["python"],
-                topics=["quantum physics"],
-                semantic_options=SemanticOptions(threshold=0.7),
-            ),
-        )
-    ]
 
-    out = run_pipeline(text=text, message_id=123, rules=rules, normalized_text=_norm(text))
-    assert out == []
+@functools.lru_cache(maxsize=1024)
+def _topic_mask(text: str) -> int:
+    t = (text or "").lower()
+    if _AUTOMATON is not None:
+        mask = 0
+        for _, dim in _AUTOMATON.iter(t):
+            mask |= 1 << dim
+        return mask
+    return sum(1 << d for d, keywords in enumerate(_DIM_KEYWORDS) if any(k in t for k in keywords))
 
 
-def test_pipeline_keyword_only_match_type_keyword() -> None:
-    text = "Python programming tutorial"
-    rules = [
-        FilterRule(
-            id=1,
-            user_id=10,
-            name="kw+sem",
-            config=FilterConfig(
-                mode=FilterMode.COMBINED,
-                keywords=["python"],
-                topics=["cooking food"],
-                semantic_options=SemanticOptions(threshold=0.7),
-            ),
-        )
-    ]
+def _embed_3d(text: str) -> np.ndarray:
+    # Read-only row of the shared table.
+    return _UNIT_BY_MASK[_topic_mask(text)]
 
-    out = run_pipeline(text=text, message_id=123, rules=rules, normalized_text=_norm(text))
-    assert len(out) == 1
-    assert out[0].matched is True
-    assert out[0].match_type.value == "keyword"
-    assert out[0].keyword_match is not None
-    assert out[0].keyword_match.has_match is True
 
+def _embed_3d_batch(texts: list[str]) -> np.ndarray:
+    # One gather from the table; fancy indexing returns a fresh (writable) array.
+    masks = np.fromiter((_topic_mask(t) for t in texts), dtype=np.intp, count=len(texts))
+    return _UNIT_BY_MASK[masks]
 
-def test_pipeline_semantic_only_match_type_semantic() -> None:
-    text = "Quantum physics breakthrough"
-    rules = [
-        FilterRule(
-            id=2,
-            user_id=10,
-            name="sem",
-            config=FilterConfig(
-                mode=FilterMode.SEMANTIC_ONLY,
-                topics=["quantum physics"],
-                semantic_options=SemanticOptions(threshold=0.7),
-            ),
-        )
-    ]
 
-    out = run_pipeline(text=text, message_id=123, rules=rules, normalized_text=_norm(text))
-    assert len(out) == 1
-    assert out[0].matched is True
-    assert out[0].match_type.value == "semantic"
-    assert out[0].semantic_match is not None
-    assert out[0].semantic_match.has_match is True
+def _fake_encode_text(text: str, use_cache: bool = True, normalize: bool = True) -> np.ndarray:
+    return _embed_3d(text)
+
+
+def _fake_encode_texts(
+    texts: list[str],
+    batch_size: int = 32,
+    normalize: bool = True,
+    show_progress: bool = False,
+) -> np.ndarray:
+    return _embed_3d_batch(texts)
+
+
+def _fake_encode_texts_cached(texts: list[str], normalize: bool = True) -> np.ndarray:
+    return _embed_3d_batch(texts)
 
 
-def test_pipeline_mixed_match_type_combined() -> None:
-    text = "Python programming news"
+@pytest.fixture(autouse=True, scope="module")
+def _patch_embeddings():
+    # Module scope, not session: a session-scoped patch would stay active for other test modules.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(sm, "encode_text", _fake_encode_text)
+        mp.setattr(sm, "encode_texts", _fake_encode_texts)
+        mp.setattr(sm, "encode_texts_cached", _fake_encode_texts_cached)
+        yield
+
+
+@functools.lru_cache(maxsize=256)
+def _norm(text: str) -> NormalizedText:
+    # Minimal normalization for semantic matcher usage (NormalizedText is frozen, so it is shared).
+    t = (text or "").lower()
+    return NormalizedText(original=text, normalized=t, tokens=t.split(), language="en")
+
+
+def _rule(
+    rule_id: int, name: str, mode: FilterMode, keywords: list[str], topics: list[str]
+) -> FilterRule:
+    return FilterRule(
+        id=rule_id,
+        user_id=10,
+        name=name,
+        config=FilterConfig(
+            mode=mode,
+            keywords=keywords,
+            topics=topics,
+            semantic_options=SemanticOptions(threshold=0.7),
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def rules_by_name() -> dict[str, FilterRule]:
     rules = [
-        FilterRule(
-            id=3,
-            user_id=10,
-            name="mixed",
-            config=FilterConfig(
-                mode=FilterMode.COMBINED,
-                keywords=["python"],
-                topics=["python coding"],
-                semantic_options=SemanticOptions(threshold=0.7),
-            ),
-        )
+        _rule(1, "combined", FilterMode.COMBINED, ["python"], ["quantum physics"]),
+        _rule(1, "kw+sem", FilterMode.COMBINED, ["python"], ["cooking food"]),
+        _rule(2, "sem", FilterMode.SEMANTIC_ONLY, [], ["quantum physics"]),
+        _rule(3, "mixed", FilterMode.COMBINED, ["python"], ["python coding"]),
     ]
+    return {rule.name: rule for rule in rules}
+
+
+@pytest.mark.parametrize(
+    ("text", "rule_name", "expected_type"),
+    [
+        pytest.param("Cooking pasta for dinner", "combined", None, id="no_matches"),
+        pytest.param("Python programming tutorial", "kw+sem", "keyword", id="keyword_only"),
+        pytest.param("Quantum physics breakthrough", "sem", "semantic", id="semantic_only"),
+        pytest.param("Python programming news", "mixed", "combined", id="mixed"),
+    ],
+)
+def test_pipeline_match_type(
+    rules_by_name: dict[str, FilterRule], text: str, rule_name: str, expected_type: str | None
+) -> None:
+    rules = [rules_by_name[rule_name]]
 
     out = run_pipeline(text=text, message_id=123, rules=rules, normalized_text=_norm(text))
+    if expected_type is None:
+        assert out == []
+        return
+
     assert len(out) == 1
     assert out[0].matched is True
-    assert out[0].match_type.value == "combined"
+    assert out[0].match_type.value == expected_type
+    if expected_type == "keyword":
+        assert out[0].keyword_match is not None
+        assert out[0].keyword_match.has_match is True
+    if expected_type == "semantic":
+        assert out[0].semantic_match is not None
+        assert out[0].semantic_match.has_match is True
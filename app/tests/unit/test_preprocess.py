@@ -4,13 +4,21 @@ Unit tests for text preprocessing module.
 Tests text normalization, cleaning, tokenization, and lemmatization.
 """
 
+import re
+from types import SimpleNamespace
+
 import pytest
 
 from app.domain.entities import Language
 from app.nlp.preprocess import (
+    _SpacyLemmatizer,
     clean_text,
     lemmatize,
+    lemmatize_english,
+    lemmatize_english_batch,
+    lemmatize_russian,
     normalize_text,
+    normalize_text_batch,
     normalize_whitespace,
     prepare_keyword,
     prepare_keywords,
@@ -20,6 +28,21 @@ from app.nlp.preprocess import (
 )
 
 
+class _FakeNlp:
+    """Minimal stand-in for a spaCy pipeline: the lemma of a token is it without trailing 's'."""
+
+    def __init__(self) -> None:
+        self.piped: list[str] = []
+
+    def __call__(self, text: str) -> list:
+        return [SimpleNamespace(lemma_=text.rstrip("s"))]
+
+    def pipe(self, texts: list[str], batch_size: int, n_process: int):
+        texts = list(texts)
+        self.piped.extend(texts)
+        return (self(t) for t in texts)
+
+
 class TestCleanText:
     """Tests for text cleaning functions."""
 
@@ -166,6 +189,78 @@ class TestLemmatization:
         lemmas = lemmatize([], language="en")
         assert lemmas == []
 
+    def test_spacy_lemmatizer_adapter(self) -> None:
+        """Test spaCy adapter exposes single-token and batch lemmatization."""
+        adapter = _SpacyLemmatizer(_FakeNlp())
+        assert adapter.lemmatize("cats") == "cat"
+        assert adapter.lemmatize_batch(["cats", "dogs"]) == ["cat", "dog"]
+
+    def test_spacy_batch_keeps_lemmas_at_token_index(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that only Latin tokens go through spaCy and every lemma stays in place."""
+        import app.nlp.preprocess as preprocess
+
+        nlp = _FakeNlp()
+        monkeypatch.setattr(preprocess, "_ENGLISH_LEMMATIZER", _SpacyLemmatizer(nlp))
+
+        tokens = ["Новости", "Cats", "2024", "dogs", "мосты", "news"]
+        assert lemmatize_english_batch(tokens) == [
+            "новости",
+            "cat",
+            "2024",
+            "dog",
+            "мосты",
+            "new",
+        ]
+        assert nlp.piped == ["cats", "dogs", "news"]
+
+    def test_spacy_batch_failure_falls_back_per_token(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a failing nlp.pipe falls back to per-token spaCy lemmatization."""
+        import app.nlp.preprocess as preprocess
+
+        class _BrokenPipeNlp(_FakeNlp):
+            def pipe(self, texts: list[str], batch_size: int, n_process: int):
+                raise RuntimeError("boom")
+
+        monkeypatch.setattr(preprocess, "_ENGLISH_LEMMATIZER", _SpacyLemmatizer(_BrokenPipeNlp()))
+        assert lemmatize_english(["Cats", "Новости", "dogs"]) == ["cat", "новости", "dog"]
+        assert lemmatize_english_batch(["Cats", "2024"]) == ["cat", "2024"]
+
+    def test_lemmatize_english_failing_token_falls_back(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that one failing token does not prevent lemmatizing the others."""
+        import app.nlp.preprocess as preprocess
+
+        class _FlakyLemmatizer:
+            def lemmatize(self, token: str) -> str:
+                if token == "bad":
+                    raise ValueError("boom")
+                return token.rstrip("s")
+
+        monkeypatch.setattr(preprocess, "_ENGLISH_LEMMATIZER", _FlakyLemmatizer())
+        assert lemmatize_english(["Cats", "BAD", "dogs"]) == ["cat", "bad", "dog"]
+
+    def test_lemmatizers_skip_tokens_of_other_scripts(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that analyzers are only called for tokens in their own alphabet."""
+        import app.nlp.preprocess as preprocess
+
+        seen: list[str] = []
+
+        class _RecordingLemmatizer:
+            def lemmatize(self, token: str) -> str:
+                seen.append(token)
+                return token
+
+        class _RecordingAnalyzer:
+            def parse(self, token: str) -> list:
+                seen.append(token)
+                return [SimpleNamespace(normal_form=token.lower())]
+
+        monkeypatch.setattr(preprocess, "_ENGLISH_LEMMATIZER", _RecordingLemmatizer())
+        monkeypatch.setattr(preprocess, "_RUSSIAN_ANALYZER", _RecordingAnalyzer())
+
+        assert lemmatize_english(["News", "Новости", "2024"]) == ["news", "новости", "2024"]
+        assert lemmatize_russian(["Новости", "Python", "2024"]) == ["новости", "python", "2024"]
+        assert seen == ["news", "Новости"]
+
 
 class TestNormalizeText:
     """Tests for main text normalization function."""
@@ -249,6 +344,34 @@ class TestNormalizeText:
         # Language detection might work or might not depending on langdetect availability
         assert result.language is None or result.language in ["en", "ru"]
 
+    def test_normalize_fused_cleaning_matches_multi_pass(self) -> None:
+        """Default (fused) cleaning should equal the step-by-step composition."""
+        texts = [
+            "Привет, мир! 🚀 Check https://example.com and @user — Python 3.12!!!",
+            "tabs\tand\nnew\x00lines\x85here\u3000too",
+            "snake_case, t.me/channel www.site.org ①②",
+            "Plain ASCII text without punctuation 42",
+            "ASCII with\x00control, and punctuation!",
+            "",
+        ]
+        for text in texts:
+            expected = clean_text(text, remove_urls=True, remove_mentions=True)
+            expected = normalize_whitespace(re.sub(r"[^\w\s]", " ", remove_emojis(expected))).lower()
+            result = normalize_text(text, remove_mentions=True, use_lemmatization=False)
+            assert result.normalized == expected
+
+    def test_normalize_batch_matches_per_text(self) -> None:
+        """Batch normalization should equal normalizing each text separately."""
+        texts = [
+            "Running dogs are better than cats",
+            "",
+            "Привет, мир! Новые технологии 🚀",
+            "https://example.com Check @user now",
+            "!!!",
+        ]
+        batch = normalize_text_batch(texts)
+        assert batch == [normalize_text(t) for t in texts]
+
 
 class TestPrepareKeywords:
     """Tests for keyword preparation functions."""
@@ -7,6 +7,7 @@ small deterministic vectors.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 
 import numpy as np
@@ -16,33 +17,62 @@ import app.filters.semantic_matcher as sm
 from app.domain.entities import FilterConfig, FilterMode, NormalizedText, SemanticMatch, SemanticOptions
 
 
-def _unit(v: np.ndarray) -> np.ndarray:
-    n = float(np.linalg.norm(v))
-    return v if n == 0 else v / n
+# 3 dimensions: python/programming, cooking/food, physics/science
+_DIM_KEYWORDS: tuple[tuple[str, ...], ...] = (
+    ("python", "program", "код"),
+    ("cook", "food", "еда", "паста"),
+    ("phys", "quant", "наука", "атом"),
+)
 
+# One alternation group per dimension: a single scan reports every dimension hit via lastindex.
+# The lookahead makes matches zero-width, so overlapping keywords ("пастатом") are all found.
+_DIM_RE = re.compile("(?=" + "|".join(f"({'|'.join(kws)})" for kws in _DIM_KEYWORDS) + ")")
 
-def _embed_3d(text: str) -> np.ndarray:
-    t = (text or "").lower()
-    # 3 dimensions: python/programming, cooking/food, physics/science
-    v = np.array(
-        [
-            1.0 if any(k in t for k in ("python", "program", "код")) else 0.0,
-            1.0 if any(k in t for k in ("cook", "food", "еда", "паста")) else 0.0,
-            1.0 if any(k in t for k in ("phys", "quant", "наука", "атом")) else 0.0,
-        ],
-        dtype=np.float32,
-    )
+
+def _compute_embeddings(texts: list[str]) -> np.ndarray:
+    out = np.zeros((len(texts), 3), dtype=np.float32)
+    for i, text in enumerate(texts):
+        for m in _DIM_RE.finditer((text or "").lower()):
+            out[i, m.lastindex - 1] = 1.0
     # if nothing matched, make it a small distinct vector so similarities are low
-    if float(v.sum()) == 0.0:
-        v = np.array([0.1, 0.1, 0.1], dtype=np.float32)
-    return _unit(v)
+    out[~out.any(axis=1)] = 0.1
+    # Row-wise squared norms without a temporary squared matrix, then scale in place.
+    sq = np.einsum("ij,ij->i", out, out)
+    inv = np.ones_like(sq)
+    np.divide(1.0, np.sqrt(sq), out=inv, where=sq > 0)
+    out *= inv[:, None]
+    return out
+
+
+# Fake embeddings are a pure function of the text, so they are shared by all tests (read-only).
+_EMBED_CACHE: dict[str, np.ndarray] = {}
+
+
+def _ensure_cached(texts: list[str]) -> None:
+    misses = [t for t in dict.fromkeys(texts) if t not in _EMBED_CACHE]
+    if misses:
+        computed = _compute_embeddings(misses)
+        computed.flags.writeable = False
+        _EMBED_CACHE.update(zip(misses, computed, strict=True))
+
+
+def _embed_3d(text: str) -> np.ndarray:
+    _ensure_cached([text])
+    return _EMBED_CACHE[text]
+
+
+def _embed_3d_batch(texts: list[str]) -> np.ndarray:
+    _ensure_cached(texts)
+    out = np.empty((len(texts), 3), dtype=np.float32)
+    for i, t in enumerate(texts):
+        out[i] = _EMBED_CACHE[t]
+    return out
 
 
 @pytest.fixture(autouse=True)
 def _patch_embeddings(monkeypatch: pytest.MonkeyPatch) -> None:
     def fake_encode_text(text: str, use_cache: bool = True, normalize: bool = True) -> np.ndarray:
-        v = _embed_3d(text)
-        return v if normalize else v
+        return _embed_3d(text)
 
     def fake_encode_texts(
         texts: list[str],
@@ -50,13 +80,11 @@ def _patch_embeddings(monkeypatch: pytest.MonkeyPatch) -> None:
         normalize: bool = True,
         show_progress: bool = False,
     ) -> np.ndarray:
-        arr = np.stack([_embed_3d(t) for t in texts], axis=0)
-        return arr if normalize else arr
+        return _embed_3d_batch(texts)
 
     def fake_encode_texts_cached(texts: list[str], normalize: bool = True) -> np.ndarray:
         # same output as non-cached; caching behavior is validated via call counts.
-        arr = np.stack([_embed_3d(t) for t in texts], axis=0)
-        return arr if normalize else arr
+        return _embed_3d_batch(texts)
 
     monkeypatch.setattr(sm, "encode_text", fake_encode_text)
     monkeypatch.setattr(sm, "encode_texts", fake_encode_texts)
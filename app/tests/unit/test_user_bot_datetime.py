@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from app.bots.user_bot.handlers import _to_naive_utc
 
@@ -18,3 +18,9 @@ class TestUserBotDatetime:
         assert out.tzinfo is None
         assert out == datetime(2025, 1, 1, 12, 0, 0)
 
+
+    def test_to_naive_utc_converts_non_utc_offset(self) -> None:
+        dt = datetime(2025, 1, 1, 15, 0, 0, tzinfo=timezone(timedelta(hours=3)))
+        out = _to_naive_utc(dt)
+        assert out.tzinfo is None
+        assert out == datetime(2025, 1, 1, 12, 0, 0)
@@ -5,6 +5,7 @@ This script demonstrates the usage of text normalization and keyword matching
 implemented in Epic 3.
 """
 
+import re
 import sys
 from pathlib import Path
 
@@ -17,11 +18,19 @@ from app.filters.keyword_matcher import (
     evaluate_filter_keywords,
     get_match_score,
     highlight_keywords,
+    keyword_match_satisfies_filter,
     match_filter_keywords,
     match_keywords_in_text,
 )
 from app.nlp.preprocess import normalize_text
 
+_CYRILLIC_RE = re.compile(r"[\u0400-\u04FF]")
+
+
+def _fast_language(text: str) -> Language:
+    """Pick Russian/English by script: this demo only has those two, so langdetect is not needed."""
+    return Language.RUSSIAN if _CYRILLIC_RE.search(text) else Language.ENGLISH
+
 
 def demo_text_normalization():
     """Demonstrate text normalization capabilities."""
@@ -39,7 +48,7 @@ def demo_text_normalization():
         print(f"\nOriginal: {text}")
         result = normalize_text(
             text,
-            language=Language.AUTO,
+            language=_fast_language(text),
             remove_urls=True,
             remove_emojis_flag=True,
             use_lemmatization=False,  # Disable for faster demo
@@ -137,8 +146,9 @@ def demo_filter_evaluation():
     ]
 
     for text in texts2:
-        matches = evaluate_filter_keywords(text, config2)
+        # One match per text: the verdict is derived from the same result that is printed.
         match_result = match_filter_keywords(text, config2)
+        matches = keyword_match_satisfies_filter(match_result, config2)
         print(
             f"'{text}' -> {matches} (found: {match_result.matched_keywords})"
         )
@@ -214,7 +224,7 @@ def demo_russian_text():
 
     for text in russian_texts:
         match_result = match_filter_keywords(text, config)
-        matches = evaluate_filter_keywords(text, config)
+        matches = keyword_match_satisfies_filter(match_result, config)
         score = get_match_score(match_result)
 
         print(f"Text: {text}")
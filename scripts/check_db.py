@@ -56,9 +56,8 @@ async def list_tables():
             tables = await conn.run_sync(_get_tables)
 
             if tables:
-                logger.info(f"Found {len(tables)} tables:")
-                for table in sorted(tables):
-                    logger.info(f"  - {table}")
+                table_list = "\n  - ".join(sorted(tables))
+                logger.info(f"Found {len(tables)} tables:\n  - {table_list}")
             else:
                 logger.warning("No tables found in database")
                 logger.info("Run 'alembic upgrade head' or 'python scripts/init_db.py' to create tables")
@@ -70,8 +69,8 @@ async def list_tables():
         return []
 
 
-async def get_table_info(table_name: str):
-    """Get information about a specific table."""
+async def get_tables_columns(table_names: list[str]) -> dict[str, list[dict]]:
+    """Get column information for several tables in one inspector query (empty on failure)."""
     db_manager = get_db_manager()
 
     try:
@@ -79,19 +78,25 @@ async def get_table_info(table_name: str):
 
             def _get_columns(sync_conn):
                 inspector = inspect(sync_conn)
-                return inspector.get_columns(table_name)
+                return inspector.get_multi_columns(filter_names=table_names)
 
-            columns = await conn.run_sync(_get_columns)
-
-            logger.info(f"\nTable: {table_name}")
-            logger.info("Columns:")
-            for col in columns:
-                nullable = "NULL" if col["nullable"] else "NOT NULL"
-                col_type = str(col["type"])
-                logger.info(f"  - {col['name']}: {col_type} {nullable}")
+            columns_by_key = await conn.run_sync(_get_columns)
+            # Keys are (schema, table_name); only the default schema is inspected here.
+            return {table: columns for (_schema, table), columns in columns_by_key.items()}
 
     except Exception as e:
         logger.error(f"Failed to get table info: {e}")
+        return {}
+
+
+def log_table_info(table_name: str, columns: list[dict]) -> None:
+    """Log information about a specific table."""
+    logger.info(f"\nTable: {table_name}")
+    logger.info("Columns:")
+    for col in columns:
+        nullable = "NULL" if col["nullable"] else "NOT NULL"
+        col_type = str(col["type"])
+        logger.info(f"  - {col['name']}: {col_type} {nullable}")
 
 
 async def main():
@@ -124,9 +129,11 @@ async def main():
         logger.info("")
         logger.info("=== Table Details ===")
         main_tables = ["users", "sources", "subscriptions", "filters", "messages"]
-        for table in main_tables:
-            if table in tables:
-                await get_table_info(table)
+        present = [table for table in main_tables if table in tables]
+        columns_by_table = await get_tables_columns(present)
+        for table in present:
+            if table in columns_by_table:
+                log_table_info(table, columns_by_table[table])
 
     # Close database
     await close_database()
@@ -6,9 +6,16 @@ This script verifies:
 - Required Python packages are installed
 - NLTK data is downloaded
 - pymorphy2 dictionaries are available
-- Basic functionality works
+- Basic functionality works (with --deep)
+
+NLTK data is only checked with --nltk: the app's default tokenizer does not need it.
+
+Usage:
+    python scripts/check_nlp_dependencies.py [--deep] [--nltk]
 """
 
+import argparse
+import importlib.util
 import sys
 import zipfile
 from pathlib import Path
@@ -32,13 +39,18 @@ def check_package(package_name: str, import_name: str = None) -> bool:
     if import_name is None:
         import_name = package_name
 
+    # find_spec only locates the module; importing it would run heavy top-level code
+    # (dictionary loading etc.) just to answer "is it installed?".
     try:
-        __import__(import_name)
+        found = importlib.util.find_spec(import_name) is not None
+    except (ImportError, ValueError):
+        found = False
+
+    if found:
         print(f"✅ {package_name} is installed")
-        return True
-    except ImportError:
+    else:
         print(f"❌ {package_name} is NOT installed")
-        return False
+    return found
 
 
 def check_nltk_data() -> bool:
@@ -87,6 +99,20 @@ def check_nltk_data() -> bool:
         return False
 
 
+# pymorphy3 analyzer, created on first use (loading the dictionaries is the expensive part).
+_MORPH = None
+
+
+def _get_morph_analyzer():
+    """Get the shared pymorphy3 analyzer for Russian (created lazily)."""
+    global _MORPH
+    if _MORPH is None:
+        import pymorphy3
+
+        _MORPH = pymorphy3.MorphAnalyzer(lang="ru")
+    return _MORPH
+
+
 def check_pymorphy2() -> bool:
     """
     Check if pymorphy2 and Russian dictionaries are available.
@@ -95,9 +121,7 @@ def check_pymorphy2() -> bool:
         True if pymorphy2 works correctly
     """
     try:
-        import pymorphy3
-
-        morph = pymorphy3.MorphAnalyzer(lang="ru")
+        morph = _get_morph_analyzer()
         # Test basic functionality
         parsed = morph.parse("программирование")[0]
         lemma = parsed.normal_form
@@ -176,8 +200,21 @@ def test_keyword_matching() -> bool:
         return False
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Run all dependency checks."""
+    parser = argparse.ArgumentParser(description="Check NLP dependencies.")
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Also run normalization/matching through the app (loads the full NLP stack).",
+    )
+    parser.add_argument(
+        "--nltk",
+        action="store_true",
+        help="Also check NLTK data (punkt, wordnet, omw-1.4); only needed for the NLTK tokenizer.",
+    )
+    args = parser.parse_args(argv)
+
     print("=" * 80)
     print("NLP Dependencies Check")
     print("=" * 80)
@@ -197,7 +234,10 @@ def main():
 
     # Check NLTK data
     print("--- NLTK Data ---")
-    check_nltk_data()  # Don't fail if data is missing - it will auto-download
+    if args.nltk:
+        check_nltk_data()  # Don't fail if data is missing - it will auto-download
+    else:
+        print("Skipped (run with --nltk if you use the NLTK tokenizer)")
     print()
 
     # Check pymorphy3
@@ -205,11 +245,14 @@ def main():
     all_ok &= check_pymorphy2()
     print()
 
-    # Test functionality
+    # Test functionality (imports app.nlp / app.filters, which is slow to start up)
     print("--- Functionality Tests ---")
-    all_ok &= test_text_normalization()
-    print()
-    all_ok &= test_keyword_matching()
+    if args.deep:
+        all_ok &= test_text_normalization()
+        print()
+        all_ok &= test_keyword_matching()
+    else:
+        print("Skipped (run with --deep to test normalization and keyword matching)")
     print()
 
     # Summary
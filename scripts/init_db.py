@@ -51,6 +51,26 @@ async def _drop_all_tables() -> None:
         await conn.run_sync(Base.metadata.drop_all)
 
 
+async def _initialize(args: argparse.Namespace) -> None:
+    """Run all database steps on one event loop (the engine's pool is bound to it)."""
+    try:
+        if args.drop:
+            logger.info("Dropping all database tables...")
+            await _drop_all_tables()
+            logger.info("All tables dropped")
+
+        if args.create_all:
+            logger.warning("Using create_all(); consider using Alembic instead")
+            db_manager = get_db_manager()
+            await db_manager.init_db(drop_existing=False)
+        else:
+            logger.info("Applying Alembic migrations (upgrade head)...")
+            # Alembic's env.py starts its own event loop, so it must run outside this one.
+            await asyncio.to_thread(_run_alembic_upgrade_head)
+    finally:
+        await close_database()
+
+
 def main() -> None:
     """Initialize database."""
     parser = argparse.ArgumentParser(description="Initialize database")
@@ -94,28 +114,13 @@ def main() -> None:
                 )
 
     try:
-        if args.drop:
-            logger.info("Dropping all database tables...")
-            asyncio.run(_drop_all_tables())
-            logger.info("All tables dropped")
-
-        if args.create_all:
-            logger.warning("Using create_all(); consider using Alembic instead")
-            db_manager = get_db_manager()
-            asyncio.run(db_manager.init_db(drop_existing=False))
-        else:
-            logger.info("Applying Alembic migrations (upgrade head)...")
-            _run_alembic_upgrade_head()
-
+        asyncio.run(_initialize(args))
         logger.info("Database initialization completed successfully")
 
     except Exception as e:
         logger.error(f"Database initialization failed: {e}", exc_info=True)
         sys.exit(1)
 
-    finally:
-        asyncio.run(close_database())
-
 
 if __name__ == "__main__":
     main()
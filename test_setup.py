@@ -8,6 +8,7 @@ This script checks that:
 3. Logging is working correctly
 """
 
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -17,29 +18,15 @@ sys.path.insert(0, str(project_root))
 
 
 def test_imports():
-    """Test that all core dependencies can be imported."""
+    """Test that all core dependencies are installed."""
     print("Testing imports...")
     
-    try:
-        import pydantic
-        print("✓ pydantic")
-    except ImportError as e:
-        print(f"✗ pydantic: {e}")
-        return False
-    
-    try:
-        import pydantic_settings
-        print("✓ pydantic_settings")
-    except ImportError as e:
-        print(f"✗ pydantic_settings: {e}")
-        return False
-    
-    try:
-        import sqlalchemy
-        print("✓ sqlalchemy")
-    except ImportError as e:
-        print(f"✗ sqlalchemy: {e}")
-        return False
+    # find_spec only locates the package; the configuration test below imports it for real.
+    for name in ("pydantic", "pydantic_settings", "sqlalchemy"):
+        if importlib.util.find_spec(name) is None:
+            print(f"✗ {name}: No module named '{name}'")
+            return False
+        print(f"✓ {name}")
     
     print()
     return True